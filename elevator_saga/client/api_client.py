@@ -19,7 +19,7 @@ from elevator_saga.core.models import (
     SimulationState,
     StepResponse,
 )
-from elevator_saga.utils.logger import debug, error, info, warning
+from elevator_saga.utils.logger import LogLevel, debug, error, get_logger, info, warning
 
 
 class ElevatorAPIClient:
@@ -156,10 +156,12 @@ class ElevatorAPIClient:
             return True
 
         endpoint = self._get_elevator_endpoint(command)
-        debug(
-            f"Sending elevator command: {command.command_type} to elevator {command.elevator_id} To:F{command.floor}",
-            prefix="CLIENT",
-        )
+        if get_logger().is_enabled_for(LogLevel.DEBUG):
+            debug(
+                f"Sending elevator command: {command.command_type} "
+                f"to elevator {command.elevator_id} To:F{command.floor}",
+                prefix="CLIENT",
+            )
 
         response_data = self._send_post_request(endpoint, command.parameters)
 
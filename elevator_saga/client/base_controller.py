@@ -7,7 +7,7 @@ import os
 import time
 from abc import ABC, abstractmethod
 from pprint import pprint
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, FrozenSet, List
 
 from elevator_saga.client.api_client import ElevatorAPIClient
 from elevator_saga.client.proxy_models import ProxyElevator, ProxyFloor, ProxyPassenger
@@ -24,6 +24,9 @@ class ElevatorController(ABC):
     用户通过继承此类并实现 abstract 方法来创建自己的调度算法
     """
 
+    # 子类不关心的事件类型，分发时直接跳过，不构造代理也不调用回调
+    IGNORED_EVENTS: FrozenSet[EventType] = frozenset()
+
     def __init__(self, server_url: str = "http://127.0.0.1:8000", debug: bool = False, client_type: str = "algorithm"):
         """
         初始化控制器
@@ -37,6 +40,21 @@ class ElevatorController(ABC):
         self.debug = debug
         self.elevators: List[Any] = []
         self.floors: List[Any] = []
+        # 按id索引的代理对象，事件处理时复用，不再为每个事件新建代理
+        self._elevator_proxies: Dict[int, ProxyElevator] = {}
+        self._floor_proxies: Dict[int, ProxyFloor] = {}
+        # 事件类型 -> 分发方法，代替逐个比较事件类型的if/elif链
+        self._event_handlers: Dict[EventType, Callable[[Dict[str, Any]], None]] = {
+            EventType.UP_BUTTON_PRESSED: self._dispatch_up_button,
+            EventType.DOWN_BUTTON_PRESSED: self._dispatch_down_button,
+            EventType.STOPPED_AT_FLOOR: self._dispatch_stopped,
+            EventType.IDLE: self._dispatch_idle,
+            EventType.PASSING_FLOOR: self._dispatch_passing_floor,
+            EventType.ELEVATOR_APPROACHING: self._dispatch_approaching,
+            EventType.PASSENGER_BOARD: self._dispatch_passenger_board,
+            EventType.PASSENGER_ALIGHT: self._dispatch_passenger_alight,
+            EventType.ELEVATOR_MOVE: self._dispatch_elevator_move,
+        }
         self.current_tick = 0
         self.is_running = False
         self.current_traffic_max_tick: int = 0
@@ -310,12 +328,14 @@ class ElevatorController(ABC):
             if not init:
                 raise ValueError(f"Elevator number mismatch: {len(self.elevators)} != {len(state.elevators)}")
             self.elevators = [ProxyElevator(elevator_state.id, self.api_client) for elevator_state in state.elevators]
+            self._elevator_proxies = {proxy._elevator_id: proxy for proxy in self.elevators}
 
         # 检查楼层数量是否发生变化，只有变化时才重新创建
         if len(self.floors) != len(state.floors):
             if not init:
                 raise ValueError(f"Floor number mismatch: {len(self.floors)} != {len(state.floors)}")
             self.floors = [ProxyFloor(floor_state.floor, self.api_client) for floor_state in state.floors]
+            self._floor_proxies = {proxy._floor_id: proxy for proxy in self.floors}
 
     def _update_traffic_info(self) -> None:
         """更新当前流量文件信息"""
@@ -331,89 +351,96 @@ class ElevatorController(ABC):
             error(f"Error updating traffic info: {e}", prefix="CONTROLLER")
             self.current_traffic_max_tick = 0
 
+    def _elevator_proxy(self, elevator_id: int) -> ProxyElevator:
+        """按id取已有的电梯代理，找不到时才新建"""
+        proxy = self._elevator_proxies.get(elevator_id)
+        if proxy is None:
+            proxy = ProxyElevator(elevator_id, self.api_client)
+        return proxy
+
+    def _floor_proxy(self, floor_id: int) -> ProxyFloor:
+        """按楼层号取已有的楼层代理，找不到时才新建"""
+        proxy = self._floor_proxies.get(floor_id)
+        if proxy is None:
+            proxy = ProxyFloor(floor_id, self.api_client)
+        return proxy
+
     def _handle_single_event(self, event: SimulationEvent) -> None:
-        """处理单个事件"""
-        if event.type == EventType.UP_BUTTON_PRESSED:
-            floor_id = event.data["floor"]
-            passenger_id = event.data["passenger"]
-            if floor_id is not None:
-                floor_proxy = ProxyFloor(floor_id, self.api_client)
-                passenger_proxy = ProxyPassenger(passenger_id, self.api_client)
-                self.on_passenger_call(passenger_proxy, floor_proxy, "up")
-
-        elif event.type == EventType.DOWN_BUTTON_PRESSED:
-            floor_id = event.data["floor"]
-            passenger_id = event.data["passenger"]
-            if floor_id is not None:
-                floor_proxy = ProxyFloor(floor_id, self.api_client)
-                passenger_proxy = ProxyPassenger(passenger_id, self.api_client)
-                self.on_passenger_call(passenger_proxy, floor_proxy, "down")
-
-        elif event.type == EventType.STOPPED_AT_FLOOR:
-            elevator_id = event.data.get("elevator")
-            floor_id = event.data["floor"]
-            if elevator_id is not None and floor_id is not None:
-                elevator_proxy = ProxyElevator(elevator_id, self.api_client)
-                floor_proxy = ProxyFloor(floor_id, self.api_client)
-                self.on_elevator_stopped(elevator_proxy, floor_proxy)
-
-        elif event.type == EventType.IDLE:
-            elevator_id = event.data.get("elevator")
-            if elevator_id is not None:
-                elevator_proxy = ProxyElevator(elevator_id, self.api_client)
-                self.on_elevator_idle(elevator_proxy)
-
-        elif event.type == EventType.PASSING_FLOOR:
-            elevator_id = event.data.get("elevator")
-            floor_id = event.data["floor"]
-            direction = event.data.get("direction")
-            if elevator_id is not None and floor_id is not None and direction is not None:
-                elevator_proxy = ProxyElevator(elevator_id, self.api_client)
-                floor_proxy = ProxyFloor(floor_id, self.api_client)
-                self.on_elevator_passing_floor(elevator_proxy, floor_proxy, direction)
-
-        elif event.type == EventType.ELEVATOR_APPROACHING:
-            elevator_id = event.data.get("elevator")
-            floor_id = event.data["floor"]
-            direction = event.data.get("direction")
-            if elevator_id is not None and floor_id is not None and direction is not None:
-                elevator_proxy = ProxyElevator(elevator_id, self.api_client)
-                floor_proxy = ProxyFloor(floor_id, self.api_client)
-                self.on_elevator_approaching(elevator_proxy, floor_proxy, direction)
-
-        elif event.type == EventType.PASSENGER_BOARD:
-            elevator_id = event.data.get("elevator")
-            passenger_id = event.data.get("passenger")
-            if elevator_id is not None and passenger_id is not None:
-                elevator_proxy = ProxyElevator(elevator_id, self.api_client)
-                passenger_proxy = ProxyPassenger(passenger_id, self.api_client)
-                self.on_passenger_board(elevator_proxy, passenger_proxy)
-
-        elif event.type == EventType.PASSENGER_ALIGHT:
-            elevator_id = event.data.get("elevator")
-            passenger_id = event.data.get("passenger")
-            floor_id = event.data["floor"]
-            if elevator_id is not None and passenger_id is not None and floor_id is not None:
-                elevator_proxy = ProxyElevator(elevator_id, self.api_client)
-                passenger_proxy = ProxyPassenger(passenger_id, self.api_client)
-                floor_proxy = ProxyFloor(floor_id, self.api_client)
-                self.on_passenger_alight(elevator_proxy, passenger_proxy, floor_proxy)
-
-        elif event.type == EventType.ELEVATOR_MOVE:
-            elevator_id = event.data.get("elevator")
-            from_position = event.data.get("from_position")
-            to_position = event.data.get("to_position")
-            direction = event.data.get("direction")
-            status = event.data.get("status")
-            if (
-                elevator_id is not None
-                and from_position is not None
-                and to_position is not None
-                and direction is not None
-                and status is not None
-            ):
-                elevator_proxy = ProxyElevator(elevator_id, self.api_client)
-                self.on_elevator_move(elevator_proxy, from_position, to_position, direction, status)
+        """处理单个事件：按事件类型查表分发"""
+        if event.type in self.IGNORED_EVENTS:
+            return
+        handler = self._event_handlers.get(event.type)
+        if handler is not None:
+            handler(event.data)
+
+    def _dispatch_up_button(self, data: Dict[str, Any]) -> None:
+        floor_id = data["floor"]
+        passenger_id = data["passenger"]
+        if floor_id is not None:
+            self.on_passenger_call(ProxyPassenger(passenger_id, self.api_client), self._floor_proxy(floor_id), "up")
+
+    def _dispatch_down_button(self, data: Dict[str, Any]) -> None:
+        floor_id = data["floor"]
+        passenger_id = data["passenger"]
+        if floor_id is not None:
+            self.on_passenger_call(ProxyPassenger(passenger_id, self.api_client), self._floor_proxy(floor_id), "down")
+
+    def _dispatch_stopped(self, data: Dict[str, Any]) -> None:
+        elevator_id = data.get("elevator")
+        floor_id = data["floor"]
+        if elevator_id is not None and floor_id is not None:
+            self.on_elevator_stopped(self._elevator_proxy(elevator_id), self._floor_proxy(floor_id))
+
+    def _dispatch_idle(self, data: Dict[str, Any]) -> None:
+        elevator_id = data.get("elevator")
+        if elevator_id is not None:
+            self.on_elevator_idle(self._elevator_proxy(elevator_id))
+
+    def _dispatch_passing_floor(self, data: Dict[str, Any]) -> None:
+        elevator_id = data.get("elevator")
+        floor_id = data["floor"]
+        direction = data.get("direction")
+        if elevator_id is not None and floor_id is not None and direction is not None:
+            self.on_elevator_passing_floor(self._elevator_proxy(elevator_id), self._floor_proxy(floor_id), direction)
+
+    def _dispatch_approaching(self, data: Dict[str, Any]) -> None:
+        elevator_id = data.get("elevator")
+        floor_id = data["floor"]
+        direction = data.get("direction")
+        if elevator_id is not None and floor_id is not None and direction is not None:
+            self.on_elevator_approaching(self._elevator_proxy(elevator_id), self._floor_proxy(floor_id), direction)
+
+    def _dispatch_passenger_board(self, data: Dict[str, Any]) -> None:
+        elevator_id = data.get("elevator")
+        passenger_id = data.get("passenger")
+        if elevator_id is not None and passenger_id is not None:
+            self.on_passenger_board(self._elevator_proxy(elevator_id), ProxyPassenger(passenger_id, self.api_client))
+
+    def _dispatch_passenger_alight(self, data: Dict[str, Any]) -> None:
+        elevator_id = data.get("elevator")
+        passenger_id = data.get("passenger")
+        floor_id = data["floor"]
+        if elevator_id is not None and passenger_id is not None and floor_id is not None:
+            self.on_passenger_alight(
+                self._elevator_proxy(elevator_id),
+                ProxyPassenger(passenger_id, self.api_client),
+                self._floor_proxy(floor_id),
+            )
+
+    def _dispatch_elevator_move(self, data: Dict[str, Any]) -> None:
+        elevator_id = data.get("elevator")
+        from_position = data.get("from_position")
+        to_position = data.get("to_position")
+        direction = data.get("direction")
+        status = data.get("status")
+        if (
+            elevator_id is not None
+            and from_position is not None
+            and to_position is not None
+            and direction is not None
+            and status is not None
+        ):
+            self.on_elevator_move(self._elevator_proxy(elevator_id), from_position, to_position, direction, status)
 
     def _reset_and_reinit(self) -> None:
         """重置并重新初始化"""
@@ -21,7 +21,7 @@ class ProxyFloor(FloorState):
     def _get_floor_state(self) -> FloorState:
         """获取 FloorState 实例"""
         state = self._api_client.get_state()
-        floor_data = next((f for f in state.floors if f.floor == self._floor_id), None)
+        floor_data = state.get_floor_by_number(self._floor_id)
         if floor_data is None:
             raise ValueError(f"Floor {self._floor_id} not found in state")
         return floor_data
@@ -67,7 +67,7 @@ class ProxyElevator(ElevatorState):
         """获取 ElevatorState 实例"""
         # 获取当前状态
         state = self._api_client.get_state()
-        elevator_data = next((e for e in state.elevators if e.id == self._elevator_id), None)
+        elevator_data = state.get_elevator_by_id(self._elevator_id)
         if elevator_data is None:
             raise ValueError(f"Elevator {self._elevator_id} not found in state")
         return elevator_data
@@ -4,6 +4,7 @@ from typing import List
 from elevator_saga.client.base_controller import ElevatorController
 from elevator_saga.client.proxy_models import ProxyElevator, ProxyFloor, ProxyPassenger
 from elevator_saga.core.models import Direction, SimulationEvent
+from elevator_saga.utils.logger import LogLevel, get_logger
 
 
 class ElevatorBusExampleController(ElevatorController):
@@ -25,14 +26,17 @@ class ElevatorBusExampleController(ElevatorController):
     def on_event_execute_start(
         self, tick: int, events: List[SimulationEvent], elevators: List[ProxyElevator], floors: List[ProxyFloor]
     ) -> None:
+        # 逐tick打印事件和每部电梯的方向、位置与车内乘客，用于观察循环线路；未开启DEBUG日志时整段跳过
+        if not get_logger().is_enabled_for(LogLevel.DEBUG):
+            return
         print(f"Tick {tick}: 即将处理 {len(events)} 个事件 {[e.type.value for e in events]}")
-        for i in elevators:
-            print(
+        print(
+            "".join(
                 f"\t{i.id}[{i.target_floor_direction.value},{i.current_floor_float}/{i.target_floor}]"
-                + "👦" * len(i.passengers),
-                end="",
+                + "👦" * len(i.passengers)
+                for i in elevators
             )
-        print()
+        )
 
     def on_event_execute_end(
         self, tick: int, events: List[SimulationEvent], elevators: List[ProxyElevator], floors: List[ProxyFloor]
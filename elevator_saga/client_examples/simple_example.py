@@ -8,6 +8,7 @@ from typing import Dict, List
 from elevator_saga.client.base_controller import ElevatorController
 from elevator_saga.client.proxy_models import ProxyElevator, ProxyFloor, ProxyPassenger
 from elevator_saga.core.models import Direction, SimulationEvent
+from elevator_saga.utils.logger import LogLevel, get_logger
 
 
 class ElevatorBusController(ElevatorController):
@@ -43,14 +44,17 @@ class ElevatorBusController(ElevatorController):
         self, tick: int, events: List[SimulationEvent], elevators: List[ProxyElevator], floors: List[ProxyFloor]
     ) -> None:
         """事件执行前的回调"""
+        # 公交车式调度的运行轨迹只在DEBUG级别下打印，否则不拼接各电梯的状态文字
+        if not get_logger().is_enabled_for(LogLevel.DEBUG):
+            return
         print(f"Tick {tick}: 即将处理 {len(events)} 个事件 {[e.type.value for e in events]}")
-        for i in elevators:
-            print(
+        print(
+            "".join(
                 f"\t{i.id}[{i.target_floor_direction.value},{i.current_floor_float}/{i.target_floor}]"
-                + "👦" * len(i.passengers),
-                end="",
+                + "👦" * len(i.passengers)
+                for i in elevators
             )
-        print()
+        )
 
     def on_event_execute_end(
         self, tick: int, events: List[SimulationEvent], elevators: List[ProxyElevator], floors: List[ProxyFloor]
@@ -360,26 +360,32 @@ class SimulationState(SerializableModel):
     events: List[SimulationEvent] = field(default_factory=list)
 
     def get_elevator_by_id(self, elevator_id: int) -> Optional[ElevatorState]:
-        """根据ID获取电梯"""
-        for elevator in self.elevators:
-            if elevator.id == elevator_id:
-                return elevator
-        return None
+        """根据ID获取电梯（首次访问时建立字典索引，之后为O(1)查找）"""
+        index: Optional[Dict[int, ElevatorState]] = self.__dict__.get("_elevator_index")
+        if index is None or len(index) != len(self.elevators):
+            index = {elevator.id: elevator for elevator in self.elevators}
+            self._elevator_index = index
+        return index.get(elevator_id)
 
     def get_floor_by_number(self, floor_number: int) -> Optional[FloorState]:
-        """根据楼层号获取楼层"""
-        for floor in self.floors:
-            if floor.floor == floor_number:
-                return floor
-        return None
+        """根据楼层号获取楼层（首次访问时建立字典索引，之后为O(1)查找）"""
+        index: Optional[Dict[int, FloorState]] = self.__dict__.get("_floor_index")
+        if index is None or len(index) != len(self.floors):
+            index = {floor.floor: floor for floor in self.floors}
+            self._floor_index = index
+        return index.get(floor_number)
 
     def get_passengers_by_status(self, status: PassengerStatus) -> List[PassengerInfo]:
         """根据状态获取乘客"""
         return [p for p in self.passengers.values() if p.status == status]
 
     def add_event(self, event_type: EventType, data: Dict[str, Any]) -> None:
-        """添加事件"""
-        event = SimulationEvent(tick=self.tick, type=event_type, data=data)
+        """添加事件（同一tick内的事件共用一个时间戳，每tick只格式化一次当前时间）"""
+        cached: Optional[Tuple[int, str]] = self.__dict__.get("_event_timestamp")
+        if cached is None or cached[0] != self.tick:
+            cached = (self.tick, datetime.now().isoformat())
+            self._event_timestamp = cached
+        event = SimulationEvent(tick=self.tick, type=event_type, data=data, timestamp=cached[1])
         self.events.append(event)
 
 
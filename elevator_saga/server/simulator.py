@@ -6,14 +6,18 @@ Provides HTTP API for controlling elevators and advancing simulation time
 """
 import argparse
 import asyncio
+import importlib
 import json
 import os.path
 import threading
 import uuid
+from bisect import insort
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from types import ModuleType
+from typing import Any, Deque, Dict, List, Optional, cast
 
 from quart import Quart, Response, request
 
@@ -24,7 +28,6 @@ from elevator_saga.core.models import (
     EventType,
     FloorState,
     PassengerInfo,
-    PassengerStatus,
     PerformanceMetrics,
     SerializableModel,
     SimulationEvent,
@@ -32,7 +35,21 @@ from elevator_saga.core.models import (
     TrafficEntry,
     create_empty_simulation_state,
 )
-from elevator_saga.utils.logger import LogLevel, debug, error, info, set_log_level, warning
+from elevator_saga.utils.logger import LogLevel, debug, error, get_logger, info, set_log_level, warning
+
+# 可选依赖：安装了orjson时用它解析流量文件，直接解析字节，速度明显快于标准库json；
+# 通过import_module导入，无论是否安装orjson，_orjson的类型都是Optional[ModuleType]
+try:
+    _orjson: Optional[ModuleType] = importlib.import_module("orjson")
+except ImportError:
+    _orjson = None
+
+
+def _parse_json_bytes(data: bytes) -> Any:
+    """解析JSON字节串，优先使用orjson，未安装时退回标准库json"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
 
 
 class ClientType(Enum):
@@ -55,6 +72,9 @@ class ClientInfo:
 class ClientManager:
     """客户端管理器 - 管理多个客户端的连接和身份"""
 
+    # 事件缓存最多保留的tick数：GUI与算法严格同步，只会读取最近的tick，更早的events不会再被读取
+    MAX_RETAINED_TICK_EVENTS = 256
+
     def __init__(self) -> None:
         self.clients: Dict[str, ClientInfo] = {}
         self.algorithm_client_id: Optional[str] = None
@@ -64,7 +84,7 @@ class ClientManager:
         self.current_tick_processed: Dict[int, bool] = {}  # tick -> 是否已被算法客户端处理
         self.tick_lock = threading.Lock()
         # 事件缓存：记录算法客户端产生的events，供GUI获取
-        self.tick_events: Dict[int, List[Any]] = {}  # target_tick -> events
+        self.tick_events: Dict[int, List[Any]] = {}  # target_tick -> events，按tick递增顺序插入，容量有上限
         self.events_lock = threading.Lock()  # Size May Change When Iter
         # 严格同步：记录GUI已确认的最后tick，确保不丢失消息
         self.gui_acknowledged_tick: int = -1  # GUI已读取到的最后一个tick
@@ -150,7 +170,8 @@ class ClientManager:
         if self.is_algorithm_client(client_id):
             with self.tick_lock:
                 self.current_tick_processed[target_tick] = True
-            debug(f"Algorithm client processed tick {target_tick}", prefix="SERVER")
+            if get_logger().is_enabled_for(LogLevel.DEBUG):
+                debug(f"Algorithm client processed tick {target_tick}", prefix="SERVER")
             return True
 
         # GUI客户端需要等待 - 使用异步协程
@@ -202,14 +223,22 @@ class ClientManager:
     def store_tick_events(self, target_tick: int, events: List[Any]) -> None:
         """存储指定tick的events"""
         with self.events_lock:
-            self.tick_events[target_tick] = events
-            debug(f"Stored {len(events)} events for tick {target_tick}", prefix="SERVER")
+            tick_events = self.tick_events
+            # 先移除同一tick的旧记录（模拟重置后tick会重新计数），保证新记录排在最后
+            tick_events.pop(target_tick, None)
+            tick_events[target_tick] = events
+            # 超出容量时丢弃最早的tick（dict保持插入顺序），没有GUI读取时缓存也不会随运行时间无限增长
+            while len(tick_events) > self.MAX_RETAINED_TICK_EVENTS:
+                del tick_events[next(iter(tick_events))]
+            if get_logger().is_enabled_for(LogLevel.DEBUG):
+                debug(f"Stored {len(events)} events for tick {target_tick}", prefix="SERVER")
 
     def get_tick_events(self, target_tick: int) -> List[Any]:
         """获取指定tick的events"""
         with self.events_lock:
             events = self.tick_events.get(target_tick, [])
-            debug(f"Retrieved {len(events)} events for tick {target_tick}", prefix="SERVER")
+            if get_logger().is_enabled_for(LogLevel.DEBUG):
+                debug(f"Retrieved {len(events)} events for tick {target_tick}", prefix="SERVER")
             return events
 
     async def wait_for_gui_acknowledgment(self, target_tick: int, timeout: float = 30.0) -> bool:
@@ -230,12 +259,14 @@ class ClientManager:
         # 如果是第一个tick（target_tick=1），不需要等待（GUI还没开始）
         if target_tick <= 1:
             return True
-        debug(f"Algorithm waiting for GUI to acknowledge tick {target_tick - 1}", prefix="SERVER")
+        if get_logger().is_enabled_for(LogLevel.DEBUG):
+            debug(f"Algorithm waiting for GUI to acknowledge tick {target_tick - 1}", prefix="SERVER")
         start_time = asyncio.get_event_loop().time()
         while True:
             # 检查GUI是否已读取到上一个tick的结果
             if self.gui_acknowledged_tick >= target_tick - 1:
-                debug(f"GUI acknowledged tick {target_tick - 1}, algorithm can proceed", prefix="SERVER")
+                if get_logger().is_enabled_for(LogLevel.DEBUG):
+                    debug(f"GUI acknowledged tick {target_tick - 1}, algorithm can proceed", prefix="SERVER")
                 return True
             # 检查超时
             elapsed = asyncio.get_event_loop().time() - start_time
@@ -247,7 +278,8 @@ class ClientManager:
     def acknowledge_gui_read(self, tick: int) -> None:
         """GUI确认已读取指定tick"""
         self.gui_acknowledged_tick = max(self.gui_acknowledged_tick, tick)
-        debug(f"GUI acknowledged tick {tick}", prefix="SERVER")
+        if get_logger().is_enabled_for(LogLevel.DEBUG):
+            debug(f"GUI acknowledged tick {tick}", prefix="SERVER")
 
     def reset(self) -> None:
         """重置客户端管理器"""
@@ -330,7 +362,7 @@ class SimulationStateResponse(SerializableModel):
 
 
 class ElevatorSimulation:
-    traffic_queue: List[TrafficEntry]  # type: ignore
+    traffic_queue: Deque[TrafficEntry]  # type: ignore
     next_passenger_id: int
     max_duration_ticks: int
 
@@ -341,7 +373,14 @@ class ElevatorSimulation:
         self.traffic_dir = Path(traffic_dir)
         self.current_traffic_index = 0
         self.traffic_files: List[Path] = []
+        # 已解析的流量文件缓存 {path: (mtime_ns, file_data)}，多轮测试重复加载同一文件时免去重新解析
+        self._traffic_file_cache: Dict[Path, tuple[int, Dict[str, Any]]] = {}
         self.state: SimulationState = create_empty_simulation_state(2, 1, 1)
+        # 按下梯顺序增量记录已完成的乘客，每次获取状态计算指标时不必遍历全部乘客
+        self._completed_passengers: List[PassengerInfo] = []
+        # 已完成乘客的楼层等待时间与总等待时间，下梯时按序插入，计算指标时无需每次重新排序
+        self._sorted_floor_wait_times: List[float] = []
+        self._sorted_arrival_wait_times: List[float] = []
         self.all_traffic_results: List[Dict[str, Any]] = []  # 存储所有traffic文件的结果
         self.start_dir = Path.cwd()  # 记录启动目录
         self._load_traffic_files()
@@ -392,8 +431,7 @@ class ElevatorSimulation:
         traffic_file = self.traffic_files[self.current_traffic_index]
         info(f"Loading traffic from {traffic_file.name}", prefix="SERVER")
         try:
-            with open(traffic_file, "r", encoding="utf-8") as f:
-                file_data = json.load(f)
+            file_data = self._read_traffic_file(traffic_file)
             building_config = file_data["building"]
             debug(f"Building config: {building_config}", prefix="SERVER")
             self.state = create_empty_simulation_state(
@@ -409,21 +447,30 @@ class ElevatorSimulation:
                     debug(f"电梯 E{elevator.id} 能耗率设置为: {elevator.energy_rate}", prefix="SERVER")
 
             self.max_duration_ticks = building_config["duration"]
-            traffic_data: list[Dict[str, Any]] = file_data["traffic"]
-            traffic_data.sort(key=lambda t: cast(int, t["tick"]))
-            for entry in traffic_data:
-                traffic_entry = TrafficEntry(
-                    id=self.next_passenger_id,
-                    origin=entry["origin"],
-                    destination=entry["destination"],
-                    tick=entry["tick"],
+            # sorted() 返回新列表，不改动缓存中的文件数据
+            traffic_data: list[Dict[str, Any]] = sorted(file_data["traffic"], key=lambda t: cast(int, t["tick"]))
+            first_id = self.next_passenger_id
+            self.traffic_queue.extend(
+                TrafficEntry(
+                    id=first_id + i, origin=entry["origin"], destination=entry["destination"], tick=entry["tick"]
                 )
-                self.traffic_queue.append(traffic_entry)
-                self.next_passenger_id += 1
+                for i, entry in enumerate(traffic_data)
+            )
+            self.next_passenger_id = first_id + len(traffic_data)
 
         except Exception as e:
             error(f"Error loading traffic file {traffic_file}: {e}", prefix="SERVER")
 
+    def _read_traffic_file(self, traffic_file: Path) -> Dict[str, Any]:
+        """读取并解析流量文件，文件未修改时直接返回缓存的解析结果"""
+        mtime_ns = traffic_file.stat().st_mtime_ns
+        cached = self._traffic_file_cache.get(traffic_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        file_data: Dict[str, Any] = _parse_json_bytes(traffic_file.read_bytes())
+        self._traffic_file_cache[traffic_file] = (mtime_ns, file_data)
+        return file_data
+
     def save_current_traffic_result(self) -> None:
         """保存当前traffic文件的结果"""
         if not self.traffic_files or self.current_traffic_index >= len(self.traffic_files):
@@ -535,12 +582,11 @@ class ElevatorSimulation:
 
     def load_traffic(self, traffic_file: str) -> None:
         """Load passenger traffic from JSON file using unified data models"""
-        with open(traffic_file, "r") as f:
-            traffic_data = json.load(f)
+        traffic_data = _parse_json_bytes(Path(traffic_file).read_bytes())
 
         debug(f"Loading traffic from {traffic_file}, {len(traffic_data)} entries", prefix="SERVER")
 
-        self.traffic_queue: List[TrafficEntry] = []  # type: ignore[reportRedeclaration]
+        entries: List[TrafficEntry] = []
         for entry in traffic_data:
             # Create TrafficEntry from JSON data
             traffic_entry = TrafficEntry(
@@ -549,17 +595,19 @@ class ElevatorSimulation:
                 destination=entry["destination"],
                 tick=entry["tick"],
             )
-            self.traffic_queue.append(traffic_entry)
+            entries.append(traffic_entry)
             self.next_passenger_id = max(self.next_passenger_id, traffic_entry.id + 1)
 
         # Sort by arrival time
-        self.traffic_queue.sort(key=lambda p: p.tick)
+        entries.sort(key=lambda p: p.tick)
+        self.traffic_queue = deque(entries)
         debug(f"Traffic loaded and sorted, next passenger ID: {self.next_passenger_id}", prefix="SERVER")
 
     def _emit_event(self, event_type: EventType, data: Dict[str, Any]) -> None:
         """Emit an event to be sent to clients using unified data models"""
         self.state.add_event(event_type, data)
-        debug(f"Event emitted: {event_type.value} with data {data}", prefix="SERVER")
+        if get_logger().is_enabled_for(LogLevel.DEBUG):
+            debug(f"Event emitted: {event_type.value} with data {data}", prefix="SERVER")
 
     def step(self, num_ticks: int = 1) -> List[SimulationEvent]:
         with self.lock:
@@ -631,7 +679,8 @@ class ElevatorSimulation:
         """更新电梯运行状态"""
         for elevator in self.elevators:
             target_floor = elevator.target_floor
-            old_status = elevator.run_status.value
+            # 只保存枚举本身，.value 仅在输出调试日志时才取
+            old_status = elevator.run_status
             # 没有移动方向，说明电梯已经到达目标楼层
             if elevator.target_floor_direction == Direction.STOPPED:
                 if elevator.next_target_floor is not None:
@@ -650,32 +699,46 @@ class ElevatorSimulation:
             elif elevator.run_status == ElevatorStatus.START_UP:
                 # 从启动状态切换到匀速
                 elevator.run_status = ElevatorStatus.CONSTANT_SPEED
-            debug(
-                f"电梯{elevator.id} 状态:{old_status}->{elevator.run_status.value} 方向:{elevator.target_floor_direction.value} "
-                f"位置:{elevator.position.current_floor_float:.1f} 目标:{target_floor}",
-                prefix="SERVER",
-            )
+            if get_logger().is_enabled_for(LogLevel.DEBUG):
+                debug(
+                    f"电梯{elevator.id} 状态:{old_status.value}->{elevator.run_status.value} "
+                    f"方向:{elevator.target_floor_direction.value} "
+                    f"位置:{elevator.position.current_floor_float:.1f} 目标:{target_floor}",
+                    prefix="SERVER",
+                )
         # START_DOWN状态会在到达目标时在_move_elevators中切换为STOPPED
 
     def _process_arrivals(self) -> None:  # OK
         """Process new passenger arrivals"""
-        while self.traffic_queue and self.traffic_queue[0].tick <= self.tick:
-            traffic_entry = self.traffic_queue.pop(0)
+        traffic_queue = self.traffic_queue
+        tick = self.tick
+        # 绝大多数tick没有新乘客，此时不做任何准备工作
+        if not traffic_queue or traffic_queue[0].tick > tick:
+            return
+        passengers = self.passengers
+        floors = self.floors
+        log_debug = get_logger().is_enabled_for(LogLevel.DEBUG)
+        while traffic_queue and traffic_queue[0].tick <= tick:
+            traffic_entry = traffic_queue.popleft()
+            origin = traffic_entry.origin
+            destination = traffic_entry.destination
             passenger = PassengerInfo(
                 id=traffic_entry.id,
-                origin=traffic_entry.origin,
-                destination=traffic_entry.destination,
-                arrive_tick=self.tick,
+                origin=origin,
+                destination=destination,
+                arrive_tick=tick,
             )
-            assert traffic_entry.origin != traffic_entry.destination, f"乘客{passenger.id}目的地和起始地{traffic_entry.origin}重复"
-            self.passengers[passenger.id] = passenger
-            debug(f"乘客 {passenger.id:4}： 创建 | {passenger}", prefix="SERVER")
-            if passenger.destination > passenger.origin:
-                self.floors[passenger.origin].up_queue.append(passenger.id)
-                self._emit_event(EventType.UP_BUTTON_PRESSED, {"floor": passenger.origin, "passenger": passenger.id})
+            assert origin != destination, f"乘客{passenger.id}目的地和起始地{origin}重复"
+            passengers[passenger.id] = passenger
+            if log_debug:
+                debug(f"乘客 {passenger.id:4}： 创建 | {passenger}", prefix="SERVER")
+            # 方向只由起止楼层决定，每位乘客比较一次，同时决定排入的队列和按钮事件
+            if destination > origin:
+                floors[origin].up_queue.append(passenger.id)
+                self._emit_event(EventType.UP_BUTTON_PRESSED, {"floor": origin, "passenger": passenger.id})
             else:
-                self.floors[passenger.origin].down_queue.append(passenger.id)
-                self._emit_event(EventType.DOWN_BUTTON_PRESSED, {"floor": passenger.origin, "passenger": passenger.id})
+                floors[origin].down_queue.append(passenger.id)
+                self._emit_event(EventType.DOWN_BUTTON_PRESSED, {"floor": origin, "passenger": passenger.id})
 
     def _move_elevators(self) -> None:
         """
@@ -776,17 +839,25 @@ class ElevatorSimulation:
                 continue
 
             # Let passengers alight
+            # 一次遍历把乘客分为下梯与留在梯内两组，不再对每个下梯乘客做一次list.remove
             passengers_to_remove: List[int] = []
+            passengers_to_stay: List[int] = []
             for passenger_id in elevator.passengers:
                 passenger = self.passengers[passenger_id]
                 if passenger.destination == current_floor:
                     passenger.dropoff_tick = self.tick
                     passenger.arrived = True
+                    self._completed_passengers.append(passenger)
+                    insort(self._sorted_floor_wait_times, float(passenger.floor_wait_time))
+                    insort(self._sorted_arrival_wait_times, float(passenger.arrival_wait_time))
                     passengers_to_remove.append(passenger_id)
+                else:
+                    passengers_to_stay.append(passenger_id)
 
             # Remove passengers who alighted
+            if passengers_to_remove:
+                elevator.passengers[:] = passengers_to_stay
             for passenger_id in passengers_to_remove:
-                elevator.passengers.remove(passenger_id)
                 self._emit_event(
                     EventType.PASSENGER_ALIGHT,
                     {"elevator": elevator.id, "floor": current_floor, "passenger": passenger_id},
@@ -814,7 +885,9 @@ class ElevatorSimulation:
             if elevator.run_status == ElevatorStatus.CONSTANT_SPEED:  # 应该减速了，但是之前是匀速
                 elevator.run_status = ElevatorStatus.START_DOWN
                 debug(f"电梯 E{elevator.id} 被设定为减速", prefix="SERVER")
-        if elevator.current_floor != floor or elevator.position.floor_up_position != 0:
+        if get_logger().is_enabled_for(LogLevel.DEBUG) and (
+            elevator.current_floor != floor or elevator.position.floor_up_position != 0
+        ):
             old_status = elevator.run_status.value
             debug(f"电梯{elevator.id} 状态:{old_status}->{elevator.run_status.value}", prefix="SERVER")
 
@@ -873,8 +946,8 @@ class ElevatorSimulation:
 
     def _calculate_metrics(self) -> PerformanceMetrics:
         """Calculate performance metrics"""
-        # 直接从state中筛选已完成的乘客
-        completed = [p for p in self.state.passengers.values() if p.status == PassengerStatus.COMPLETED]
+        # 已完成的乘客在下梯时增量记录
+        completed = self._completed_passengers
 
         total_passengers = len(self.state.passengers)
 
@@ -892,14 +965,14 @@ class ElevatorSimulation:
                 total_energy_consumption=total_energy,
             )
 
-        floor_wait_times = [float(p.floor_wait_time) for p in completed]
-        arrival_wait_times = [float(p.arrival_wait_time) for p in completed]
+        # 两组等待时间在乘客下梯时已按升序维护
+        floor_wait_times = self._sorted_floor_wait_times
+        arrival_wait_times = self._sorted_arrival_wait_times
 
-        def average_excluding_top_percent(data: List[float], exclude_percent: int) -> float:
-            """计算排除掉最长的指定百分比后的平均值"""
-            if not data:
+        def average_excluding_top_percent(sorted_data: List[float], exclude_percent: int) -> float:
+            """计算排除掉最长的指定百分比后的平均值，sorted_data须已按升序排列"""
+            if not sorted_data:
                 return 0.0
-            sorted_data = sorted(data)
             # 计算要保留的数据数量（排除掉最长的 exclude_percent）
             keep_count = int(len(sorted_data) * (100 - exclude_percent) / 100)
             if keep_count == 0:
@@ -946,7 +1019,10 @@ class ElevatorSimulation:
             self.state = create_empty_simulation_state(
                 len(self.elevators), len(self.floors), self.elevators[0].max_capacity
             )
-            self.traffic_queue: List[TrafficEntry] = []
+            self.traffic_queue: Deque[TrafficEntry] = deque()
+            self._completed_passengers.clear()
+            self._sorted_floor_wait_times.clear()
+            self._sorted_arrival_wait_times.clear()
             self.max_duration_ticks = 0
             self.next_passenger_id = 1
             self.all_traffic_results.clear()  # 清空累积结果
@@ -129,7 +129,9 @@ class Logger:
             return
 
         formatted = self._format_message(level, message, prefix)
-        print(formatted, flush=True)
+        # DEBUG日志数量最多（每个事件都有），不逐条强制刷新，由输出缓冲批量写出；
+        # INFO及以上级别立即刷新，连同之前缓冲的DEBUG日志一并输出，保证顺序不变
+        print(formatted, flush=level is not LogLevel.DEBUG)
 
     def debug(self, message: str, prefix: Optional[str] = None) -> None:
         """记录DEBUG级别日志"""
@@ -147,6 +149,10 @@ class Logger:
         """记录ERROR级别日志"""
         self._log(LogLevel.ERROR, message, prefix)
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """判断指定级别的日志是否会被输出，用于在热路径上跳过消息格式化"""
+        return level.value >= self.min_level.value
+
     def set_level(self, level: LogLevel) -> None:
         """设置最低日志级别"""
         self.min_level = level
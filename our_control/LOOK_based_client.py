@@ -1,68 +1,137 @@
 #!/usr/bin/env python3
+from bisect import bisect_left, bisect_right
 from typing import Dict, List, Set, Tuple
 
 from elevator_saga.client.base_controller import ElevatorController
 from elevator_saga.client.proxy_models import ProxyElevator, ProxyFloor, ProxyPassenger
-from elevator_saga.core.models import SimulationEvent
+from elevator_saga.core.models import EventType, SimulationEvent
+from elevator_saga.utils.logger import LogLevel, debug, get_logger, info
+
+# 方向的整数编码：内部统一用整数比较，仅在回调接口处与字符串互转
+DIR_UP = 1
+DIR_DOWN = -1
+DIR_STOPPED = 0
+_DIR = {"up": DIR_UP, "down": DIR_DOWN, "stopped": DIR_STOPPED}
+_DIR_INV = {code: name for name, code in _DIR.items()}
+
+# 呼叫分配的附加分数 {(电梯方向 * 呼叫方向, 是否顺路经过呼叫楼层): penalty}
+# 同向且顺路最优先，同向需掉头+20，空闲电梯+2，反方向+30
+_CALL_PENALTY = {
+    (1, True): 0,
+    (1, False): 20,
+    (0, True): 2,
+    (0, False): 2,
+    (-1, True): 30,
+    (-1, False): 30,
+}
+
+# 无人等待楼层的 (up_count, down_count)
+_NO_WAITING = (0, 0)
+# 方向字符串 -> 楼层快照 (up_count, down_count) 中对应等待人数的下标
+_WAITING_INDEX = {"up": 0, "down": 1}
+
+
+def _call_score(current_floor: int, elevator_direction: int, floor: int, call_direction: int) -> int:
+    """呼叫分配分数：距离 + 按方向关系查表得到的附加分，只做整数运算"""
+    offset = floor - current_floor
+    return abs(offset) + _CALL_PENALTY[elevator_direction * call_direction, offset * call_direction >= 0]
 
 
 class LOOKElevatorController(ElevatorController):
     """基于LOOK算法的电梯调度控制器"""
+
+    # 即将到达与移动事件不参与调度，分发时跳过；经过楼层事件用于顺路接客，仍需处理
+    IGNORED_EVENTS = frozenset({EventType.ELEVATOR_APPROACHING, EventType.ELEVATOR_MOVE})
     
     def __init__(self):
         super().__init__("http://127.0.0.1:8000", True)
-        # 每个电梯的目标楼层集合
-        self.elevator_targets: Dict[int, Set[int]] = {}
-        # 每个电梯的当前方向（"up", "down", "stopped"）
-        self.elevator_directions: Dict[int, str] = {}
-        # 等待分配的呼叫请求 {(floor, direction): first_call_tick}
-        self.pending_calls: Dict[Tuple[int, str], int] = {}
+        # 每个电梯的目标楼层（升序列表，便于按方向二分查找）
+        self.elevator_targets: Dict[int, List[int]] = {}
+        # 每个电梯的当前方向（DIR_UP, DIR_DOWN, DIR_STOPPED）
+        self.elevator_directions: Dict[int, int] = {}
+        # 等待分配的呼叫楼层，按方向拆分
+        self._pending_up: Set[int] = set()
+        self._pending_down: Set[int] = set()
+        # 反向索引：目标楼层 -> 以该楼层为目标的电梯ID集合（on_init中为每层预先建好空集合）
+        self.floor_to_elevators: Dict[int, Set[int]] = {}
+        self._elevator_by_id: Dict[int, ProxyElevator] = {}
+        # 当前tick的电梯状态快照 {elevator_id: (current_floor, is_full, free_capacity)}
+        self._elevator_snapshot: Dict[int, Tuple[int, bool, int]] = {}
+        # 当前tick有人等待的楼层快照 {floor: (up_count, down_count)}，无人等待的楼层不在其中
+        self._floor_queues: Dict[int, Tuple[int, int]] = {}
+        # 本tick待发送的电梯指令，同一电梯以最后一次为准 {elevator_id: floor}
+        self._cmd_buffer: Dict[int, int] = {}
+        # 本tick内是否发生了可能影响调度的事件
+        self._dirty = False
+        # _get_elevators_heading_to 的结果缓存 {(floor, direction): elevator_ids}，
+        # 目标、方向或电梯快照变化时整体失效
+        self._heading_cache: Dict[Tuple[int, int], Set[int]] = {}
+        self._logger = get_logger()
         
     def on_init(self, elevators: List[ProxyElevator], floors: List[ProxyFloor]) -> None:
         """初始化电梯状态"""
-        print(f"初始化: {len(elevators)}个电梯, {len(floors)}层楼")
+        info(f"初始化: {len(elevators)}个电梯, {len(floors)}层楼", prefix="CONTROLLER")
+        self.floor_to_elevators = {floor.floor: set() for floor in floors}
+        self._elevator_by_id = {elevator.id: elevator for elevator in elevators}
+        self._cmd_buffer = {}
+        self._dirty = False
+        self._heading_cache = {}
         for elevator in elevators:
-            self.elevator_targets[elevator.id] = set()
-            self.elevator_directions[elevator.id] = "stopped"
+            self.elevator_targets[elevator.id] = []
+            self.elevator_directions[elevator.id] = DIR_STOPPED
+        self._snapshot_elevators()
+        self._snapshot_floors()
 
     def on_event_execute_start(
         self, tick: int, events: List[SimulationEvent], elevators: List[ProxyElevator], floors: List[ProxyFloor]
     ) -> None:
-        """事件执行前的处理"""
-        pass
+        """事件执行前的处理 - 同一tick内状态不变，在此统一快照电梯和楼层状态"""
+        # 没有事件也没有待处理呼叫时，本tick不会读取快照，直接跳过
+        if not events and not self._pending_up and not self._pending_down:
+            return
+        self._snapshot_elevators()
+        self._snapshot_floors()
 
     def on_event_execute_end(
         self, tick: int, events: List[SimulationEvent], elevators: List[ProxyElevator], floors: List[ProxyFloor]
     ) -> None:
-        """事件执行后的处理 - 为空闲电梯分配任务"""
-        self._assign_pending_calls(elevators, floors)
+        """事件执行后的处理 - 为空闲电梯分配任务，并统一发送本tick的指令"""
+        # 没有新事件且没有待处理呼叫时，无需重新扫描
+        if self._dirty or self._pending_up or self._pending_down:
+            self._assign_pending_calls(elevators, floors)
+            self._dirty = False
+        self._flush_commands()
 
     def on_passenger_call(self, passenger: ProxyPassenger, floor: ProxyFloor, direction: str) -> None:
         """处理乘客呼叫"""
-        print(f"Tick {self.current_tick}: 乘客{passenger.id}在{floor.floor}层呼叫电梯，方向: {direction}")
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            debug(f"Tick {self.current_tick}: 乘客{passenger.id}在{floor.floor}层呼叫电梯，方向: {direction}", prefix="CONTROLLER")
+        self._dirty = True
+        direction_code = _DIR[direction]
         
         # 将呼叫请求加入待处理队列
-        call_key = (floor.floor, direction)
-        if call_key not in self.pending_calls:
-            self.pending_calls[call_key] = self.current_tick
+        pending = self._pending_up if direction_code == DIR_UP else self._pending_down
+        pending.add(floor.floor)
         
         # 尝试立即分配给合适的电梯
-        self._assign_call_to_elevator(floor.floor, direction)
+        self._assign_call_to_elevator(floor.floor, direction_code)
 
     def on_elevator_idle(self, elevator: ProxyElevator) -> None:
         """电梯空闲时的处理"""
-        print(f"Tick {self.current_tick}: 电梯{elevator.id}空闲")
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            debug(f"Tick {self.current_tick}: 电梯{elevator.id}空闲", prefix="CONTROLLER")
+        self._dirty = True
         # 清除该电梯的方向和目标
-        self.elevator_directions[elevator.id] = "stopped"
-        self.elevator_targets[elevator.id].clear()
+        self._set_direction(elevator.id, DIR_STOPPED)
+        self._clear_targets(elevator.id)
         # 尝试分配新任务
         self._assign_task_to_idle_elevator(elevator)
 
     def on_elevator_stopped(self, elevator: ProxyElevator, floor: ProxyFloor) -> None:
         """电梯停靠时的处理"""
+        self._dirty = True
         # 从目标集合中移除当前楼层
-        if floor.floor in self.elevator_targets[elevator.id]:
-            self.elevator_targets[elevator.id].discard(floor.floor)
+        self._remove_target(elevator.id, floor.floor)
         
         # 检查该楼层是否还有等待的乘客
         self._check_and_remove_pending_calls(floor)
@@ -73,109 +142,148 @@ class LOOKElevatorController(ElevatorController):
     def on_passenger_board(self, elevator: ProxyElevator, passenger: ProxyPassenger) -> None:
         """乘客上梯时添加目的楼层"""
         dest = passenger.destination
-        self.elevator_targets[elevator.id].add(dest)
-        print(f"Tick {self.current_tick}: 乘客{passenger.id}上电梯{elevator.id}，目的地{dest}层")
+        self._add_target(elevator.id, dest)
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            debug(f"Tick {self.current_tick}: 乘客{passenger.id}上电梯{elevator.id}，目的地{dest}层", prefix="CONTROLLER")
 
     def on_passenger_alight(self, elevator: ProxyElevator, passenger: ProxyPassenger, floor: ProxyFloor) -> None:
         """乘客下梯"""
-        print(f"Tick {self.current_tick}: 乘客{passenger.id}在{floor.floor}层下电梯{elevator.id}")
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            debug(f"Tick {self.current_tick}: 乘客{passenger.id}在{floor.floor}层下电梯{elevator.id}", prefix="CONTROLLER")
 
     def on_elevator_passing_floor(self, elevator: ProxyElevator, floor: ProxyFloor, direction: str) -> None:
         """电梯经过楼层 - LOOK算法核心：顺路接客"""
         # 直接检查楼层的实际等待队列，而不是依赖pending_calls
-        if not elevator.is_full:
-            has_waiting = False
-            if direction == "up" and len(floor.up_queue) > 0:
-                has_waiting = True
-            elif direction == "down" and len(floor.down_queue) > 0:
-                has_waiting = True
-            
-            if has_waiting:
-                self.elevator_targets[elevator.id].add(floor.floor)
-                print(f"Tick {self.current_tick}: 电梯{elevator.id}顺路接客，增加目标楼层{floor.floor}")
+        if not self._elevator_snapshot[elevator.id][1]:
+            # 按经过方向直接取对应方向的等待人数，一次下标读取代替分支判断
+            index = _WAITING_INDEX.get(direction)
+            if index is not None and self._floor_queues.get(floor.floor, _NO_WAITING)[index]:
+                self._add_target(elevator.id, floor.floor)
+                if self._logger.is_enabled_for(LogLevel.DEBUG):
+                    debug(f"Tick {self.current_tick}: 电梯{elevator.id}顺路接客，增加目标楼层{floor.floor}", prefix="CONTROLLER")
 
     def on_elevator_approaching(self, elevator: ProxyElevator, floor: ProxyFloor, direction: str) -> None:
         """电梯即将到达楼层"""
         pass
 
-    def _get_elevators_heading_to(self, floor: int, direction: str) -> List[ProxyElevator]:
-        """获取正在前往指定楼层的电梯列表"""
-        heading_elevators = []
-        for elevator in self.elevators:
-            # 检查目标中是否包含该楼层
-            if floor not in self.elevator_targets[elevator.id]:
-                continue
-            
-            elevator_dir = self.elevator_directions[elevator.id]
-            current_floor = elevator.current_floor
+    def _snapshot_elevators(self) -> None:
+        """快照电梯状态，避免在调度循环中反复访问代理属性"""
+        self._heading_cache.clear()
+        # 与楼层快照相同，直接读取本tick缓存的电梯状态数据，不经过代理
+        self._elevator_snapshot = {
+            e.id: (e.current_floor, e.is_full, e.max_capacity - len(e.passengers))
+            for e in self.api_client.get_state().elevators
+        }
+
+    def _snapshot_floors(self) -> None:
+        """快照有人等待楼层的上下行等待人数，调度循环只需遍历这些楼层"""
+        # 同一tick内状态已缓存，直接遍历一次楼层状态数据，避免每次读取队列都经过代理按楼层号查找
+        floor_queues: Dict[int, Tuple[int, int]] = {}
+        for f in self.api_client.get_state().floors:
+            up_count, down_count = len(f.up_queue), len(f.down_queue)
+            if up_count or down_count:
+                floor_queues[f.floor] = (up_count, down_count)
+        self._floor_queues = floor_queues
+
+    def _add_target(self, elevator_id: int, floor: int) -> None:
+        """添加电梯目标楼层，同时维护反向索引"""
+        self._heading_cache.clear()
+        targets = self.elevator_targets[elevator_id]
+        i = bisect_left(targets, floor)
+        if i == len(targets) or targets[i] != floor:
+            targets.insert(i, floor)
+        self.floor_to_elevators[floor].add(elevator_id)
+
+    def _remove_target(self, elevator_id: int, floor: int) -> None:
+        """移除电梯目标楼层，同时维护反向索引"""
+        self._heading_cache.clear()
+        targets = self.elevator_targets[elevator_id]
+        i = bisect_left(targets, floor)
+        if i < len(targets) and targets[i] == floor:
+            del targets[i]
+        self.floor_to_elevators[floor].discard(elevator_id)
+
+    def _set_direction(self, elevator_id: int, direction: int) -> None:
+        """设置电梯方向，方向变化会使前往楼层的缓存失效"""
+        if self.elevator_directions[elevator_id] != direction:
+            self.elevator_directions[elevator_id] = direction
+            self._heading_cache.clear()
+
+    def _clear_targets(self, elevator_id: int) -> None:
+        """清空电梯所有目标楼层，同时维护反向索引"""
+        targets = self.elevator_targets[elevator_id]
+        if not targets:
+            return
+        # 直接整体清空有序列表，无需逐个二分删除
+        for floor in targets:
+            self.floor_to_elevators[floor].discard(elevator_id)
+        targets.clear()
+        self._heading_cache.clear()
+
+    def _get_elevators_heading_to(self, floor: int, direction: int) -> Set[int]:
+        """获取正在前往指定楼层的电梯ID集合（结果只读，在状态变化前可复用）"""
+        key = (floor, direction)
+        cached = self._heading_cache.get(key)
+        if cached is not None:
+            return cached
+        heading_ids: Set[int] = set()
+        # 只遍历以该楼层为目标的电梯，而不是所有电梯
+        for elevator_id in self.floor_to_elevators[floor]:
+            elevator_dir = self.elevator_directions[elevator_id]
             
             # 检查方向是否匹配
             if elevator_dir == direction:
-                # 检查是否会经过该楼层
-                if direction == "up" and current_floor <= floor:
-                    heading_elevators.append(elevator)
-                elif direction == "down" and current_floor >= floor:
-                    heading_elevators.append(elevator)
-            elif elevator_dir == "stopped" and floor in self.elevator_targets[elevator.id]:
+                current_floor = self._elevator_snapshot[elevator_id][0]
+                # 检查是否会经过该楼层：楼层位于运行方向的前方（含当前楼层）
+                if (floor - current_floor) * direction >= 0:
+                    heading_ids.add(elevator_id)
+            elif elevator_dir == DIR_STOPPED:
                 # 空闲但已分配该楼层
-                heading_elevators.append(elevator)
+                heading_ids.add(elevator_id)
         
-        return heading_elevators
+        self._heading_cache[key] = heading_ids
+        return heading_ids
 
-    def _assign_call_to_elevator(self, floor: int, direction: str) -> bool:
+    def _assign_call_to_elevator(self, floor: int, direction: int) -> bool:
         """分配呼叫到最合适的电梯"""
         # 检查是否已经有足够的电梯在处理这个呼叫
-        heading_elevators = self._get_elevators_heading_to(floor, direction)
-        if heading_elevators:
+        heading_ids = self._get_elevators_heading_to(floor, direction)
+        if heading_ids:
             # 获取实际等待的乘客数量
-            floor_obj = next((f for f in self.floors if f.floor == floor), None)
-            if floor_obj:
-                waiting_count = len(floor_obj.up_queue) if direction == "up" else len(floor_obj.down_queue)
-                # 计算总可用容量
-                total_capacity = sum(e.max_capacity - len(e.passengers) for e in heading_elevators)
-                # 如果已有电梯且容量足够接走所有等待的乘客，就不再分配新电梯
-                if total_capacity >= waiting_count:
-                    return True
+            queues = self._floor_queues.get(floor, _NO_WAITING)
+            waiting_count = queues[0] if direction == DIR_UP else queues[1]
+            # 计算总可用容量
+            total_capacity = sum(self._elevator_snapshot[elevator_id][2] for elevator_id in heading_ids)
+            # 如果已有电梯且容量足够接走所有等待的乘客，就不再分配新电梯
+            if total_capacity >= waiting_count:
+                return True
         
-        best_elevator = None
-        best_score = float('inf')
-        
-        for elevator in self.elevators:
-            # 跳过满载的电梯
-            if elevator.is_full:
-                continue
-            
-            # 跳过已经在处理该呼叫的电梯
-            if elevator in heading_elevators:
-                continue
-            
-            current_floor = elevator.current_floor
-            current_direction = self.elevator_directions[elevator.id]
-            distance = abs(current_floor - floor)
-            
-            # 计算分配分数
-            score = distance
-            
-            if current_direction == direction:
-                if direction == "up" and current_floor <= floor:
-                    score = distance  # 最优先
-                elif direction == "down" and current_floor >= floor:
-                    score = distance  # 最优先
-                else:
-                    score = distance + 20  # 需要掉头
-            elif current_direction == "stopped":
-                score = distance + 2  # 空闲电梯
-            else:
-                score = distance + 30  # 反方向
-            
-            if score < best_score:
-                best_score = score
-                best_elevator = elevator
+        # 跳过满载和已经在处理该呼叫的电梯，取分数最低者（同分时保留先出现的电梯）
+        candidate_ids = [
+            elevator_id
+            for elevator_id, (_, is_full, _) in self._elevator_snapshot.items()
+            if not is_full and elevator_id not in heading_ids
+        ]
+        if len(candidate_ids) <= 1:
+            # 单电梯或只剩一个候选时无需计算分数
+            best_id = candidate_ids[0] if candidate_ids else None
+        else:
+            # 逐个比较分数，只在严格更优时替换，与min的取首个最小值一致
+            directions = self.elevator_directions
+            snapshot = self._elevator_snapshot
+            best_id = candidate_ids[0]
+            best_score = _call_score(snapshot[best_id][0], directions[best_id], floor, direction)
+            for elevator_id in candidate_ids[1:]:
+                score = _call_score(snapshot[elevator_id][0], directions[elevator_id], floor, direction)
+                if score < best_score:
+                    best_id = elevator_id
+                    best_score = score
+        best_elevator = self._elevator_by_id[best_id] if best_id is not None else None
         
         if best_elevator:
-            self.elevator_targets[best_elevator.id].add(floor)
-            if self.elevator_directions[best_elevator.id] == "stopped":
-                self.elevator_directions[best_elevator.id] = direction
+            self._add_target(best_elevator.id, floor)
+            if self.elevator_directions[best_elevator.id] == DIR_STOPPED:
+                self._set_direction(best_elevator.id, direction)
                 self._set_next_target(best_elevator)
             return True
         
@@ -187,135 +295,150 @@ class LOOKElevatorController(ElevatorController):
         min_score = float('inf')
         target_floor = None
         target_direction = None
+        current_floor = self._elevator_snapshot[elevator.id][0]
         
-        for floor in self.floors:
-            # 检查上行队列
-            if len(floor.up_queue) > 0:
+        for floor_number, (up_count, down_count) in self._floor_queues.items():
+            distance = abs(current_floor - floor_number)
+            # 依次检查上行、下行队列
+            for direction, waiting_count in ((DIR_UP, up_count), (DIR_DOWN, down_count)):
+                if waiting_count == 0:
+                    continue
                 # 检查是否已有其他电梯在处理
-                heading_elevators = self._get_elevators_heading_to(floor.floor, "up")
-                if not heading_elevators:
-                    distance = abs(elevator.current_floor - floor.floor)
-                    # 考虑等待的乘客数量
-                    score = distance - len(floor.up_queue) * 2
-                    if score < min_score:
-                        min_score = score
-                        target_floor = floor.floor
-                        target_direction = "up"
-            
-            # 检查下行队列
-            if len(floor.down_queue) > 0:
-                # 检查是否已有其他电梯在处理
-                heading_elevators = self._get_elevators_heading_to(floor.floor, "down")
-                if not heading_elevators:
-                    distance = abs(elevator.current_floor - floor.floor)
-                    # 考虑等待的乘客数量
-                    score = distance - len(floor.down_queue) * 2
-                    if score < min_score:
-                        min_score = score
-                        target_floor = floor.floor
-                        target_direction = "down"
+                if self._get_elevators_heading_to(floor_number, direction):
+                    continue
+                # 考虑等待的乘客数量
+                score = distance - waiting_count * 2
+                if score < min_score:
+                    min_score = score
+                    target_floor = floor_number
+                    target_direction = direction
         
         if target_floor is not None and target_direction is not None:
-            self.elevator_targets[elevator.id].add(target_floor)
-            self.elevator_directions[elevator.id] = target_direction
+            self._add_target(elevator.id, target_floor)
+            self._set_direction(elevator.id, target_direction)
             self._set_next_target(elevator)
-            print(f"Tick {self.current_tick}: 为空闲电梯{elevator.id}分配任务: 前往{target_floor}层({target_direction})")
+            if self._logger.is_enabled_for(LogLevel.DEBUG):
+                debug(
+                    f"Tick {self.current_tick}: 为空闲电梯{elevator.id}分配任务: 前往{target_floor}层({_DIR_INV[target_direction]})",
+                    prefix="CONTROLLER",
+                )
 
     def _set_next_target(self, elevator: ProxyElevator) -> None:
         """根据LOOK算法设置电梯的下一个目标"""
         targets = self.elevator_targets[elevator.id]
+        # 当前楼层从本tick快照读取，避免多次经过代理
+        current_floor = self._elevator_snapshot[elevator.id][0]
         
         if not targets:
             # 没有目标时，让电梯停在当前位置并触发IDLE
-            self.elevator_directions[elevator.id] = "stopped"
+            self._set_direction(elevator.id, DIR_STOPPED)
             # 重要：发送go_to_floor到当前楼层，让模拟器知道电梯应该停止
             # 这样target_floor = current_floor，target_floor_direction = STOPPED
             # 从而触发IDLE事件
-            if elevator.current_floor is not None:
-                elevator.go_to_floor(elevator.current_floor)
+            if current_floor is not None:
+                self._go_to_floor(elevator, current_floor)
             return
         
-        current_floor = elevator.current_floor
         current_direction = self.elevator_directions[elevator.id]
         next_floor = current_floor
         
         # 根据当前方向选择下一个目标
-        if current_direction == "up":
-            up_targets = [f for f in targets if f > current_floor]
-            if up_targets:
-                next_floor = min(up_targets)
+        if current_direction == DIR_UP:
+            i = bisect_right(targets, current_floor)
+            if i < len(targets):
+                next_floor = targets[i]
             else:
                 # 没有上行目标，反向
-                self.elevator_directions[elevator.id] = "down"
-                down_targets = [f for f in targets if f <= current_floor]
-                if down_targets:
-                    next_floor = max(down_targets)
+                self._set_direction(elevator.id, DIR_DOWN)
+                if i > 0:
+                    next_floor = targets[i - 1]
                 else:
-                    self.elevator_directions[elevator.id] = "stopped"
-                    elevator.go_to_floor(current_floor)
+                    self._set_direction(elevator.id, DIR_STOPPED)
+                    self._go_to_floor(elevator, current_floor)
                     return
         
-        elif current_direction == "down":
-            down_targets = [f for f in targets if f < current_floor]
-            if down_targets:
-                next_floor = max(down_targets)
+        elif current_direction == DIR_DOWN:
+            i = bisect_left(targets, current_floor)
+            if i > 0:
+                next_floor = targets[i - 1]
             else:
                 # 没有下行目标，反向
-                self.elevator_directions[elevator.id] = "up"
-                up_targets = [f for f in targets if f >= current_floor]
-                if up_targets:
-                    next_floor = min(up_targets)
+                self._set_direction(elevator.id, DIR_UP)
+                if i < len(targets):
+                    next_floor = targets[i]
                 else:
-                    self.elevator_directions[elevator.id] = "stopped"
-                    elevator.go_to_floor(current_floor)
+                    self._set_direction(elevator.id, DIR_STOPPED)
+                    self._go_to_floor(elevator, current_floor)
                     return
         
         else:  # stopped
-            next_floor = min(targets, key=lambda f: abs(f - current_floor))
+            # 二分定位当前楼层两侧最近的目标，距离相同时优先较低楼层
+            i = bisect_left(targets, current_floor)
+            if i == len(targets):
+                next_floor = targets[i - 1]
+            elif i == 0 or targets[i] - current_floor < current_floor - targets[i - 1]:
+                next_floor = targets[i]
+            else:
+                next_floor = targets[i - 1]
             if next_floor > current_floor:
-                self.elevator_directions[elevator.id] = "up"
+                self._set_direction(elevator.id, DIR_UP)
             elif next_floor < current_floor:
-                self.elevator_directions[elevator.id] = "down"
+                self._set_direction(elevator.id, DIR_DOWN)
             else:
                 # 当前楼层就是目标
                 return
         
         # 发送电梯移动指令
         if next_floor != current_floor:
-            elevator.go_to_floor(next_floor)
+            self._go_to_floor(elevator, next_floor)
+
+    def _go_to_floor(self, elevator: ProxyElevator, floor: int) -> None:
+        """缓存电梯移动指令，在tick结束时统一发送"""
+        # 模拟器每个tick只消费最后一次设置的next_target_floor，因此同一电梯只保留最后一条指令；
+        # 跨tick的重复指令（例如停在当前楼层）会触发IDLE，不能省略
+        self._cmd_buffer[elevator.id] = floor
+
+    def _flush_commands(self) -> None:
+        """发送本tick缓存的电梯指令"""
+        for elevator_id, floor in self._cmd_buffer.items():
+            self._elevator_by_id[elevator_id].go_to_floor(floor)
+        self._cmd_buffer.clear()
 
     def _check_and_remove_pending_calls(self, floor: ProxyFloor) -> None:
         """检查并移除已完成的呼叫请求"""
         # 只有当队列为空时才删除pending_calls
-        if len(floor.up_queue) == 0:
-            call_key = (floor.floor, "up")
-            if call_key in self.pending_calls:
-                del self.pending_calls[call_key]
+        up_count, down_count = self._floor_queues.get(floor.floor, _NO_WAITING)
+        if up_count == 0:
+            self._pending_up.discard(floor.floor)
         
-        if len(floor.down_queue) == 0:
-            call_key = (floor.floor, "down")
-            if call_key in self.pending_calls:
-                del self.pending_calls[call_key]
+        if down_count == 0:
+            self._pending_down.discard(floor.floor)
 
     def _assign_pending_calls(self, elevators: List[ProxyElevator], floors: List[ProxyFloor]) -> None:
         """为所有待处理的呼叫分配电梯"""
-        # 清理已经没有等待乘客的pending_calls
-        for floor in floors:
-            self._check_and_remove_pending_calls(floor)
-        
-        # 直接检查每个楼层的等待队列
-        for floor in floors:
+        # 只遍历有人等待的楼层，为尚无电梯前往的呼叫分配电梯；
+        # 同一遍中顺带收集仍有人等待的pending_calls，已无人等待的楼层自然被清理
+        pending_up = self._pending_up
+        pending_down = self._pending_down
+        still_up: Set[int] = set()
+        still_down: Set[int] = set()
+        for floor_number, (up_count, down_count) in self._floor_queues.items():
             # 检查上行队列
-            if len(floor.up_queue) > 0:
-                heading_elevators = self._get_elevators_heading_to(floor.floor, "up")
-                if not heading_elevators:
-                    self._assign_call_to_elevator(floor.floor, "up")
+            if up_count > 0:
+                if not self._get_elevators_heading_to(floor_number, DIR_UP):
+                    self._assign_call_to_elevator(floor_number, DIR_UP)
+                if floor_number in pending_up:
+                    still_up.add(floor_number)
             
             # 检查下行队列
-            if len(floor.down_queue) > 0:
-                heading_elevators = self._get_elevators_heading_to(floor.floor, "down")
-                if not heading_elevators:
-                    self._assign_call_to_elevator(floor.floor, "down")
+            if down_count > 0:
+                if not self._get_elevators_heading_to(floor_number, DIR_DOWN):
+                    self._assign_call_to_elevator(floor_number, DIR_DOWN)
+                if floor_number in pending_down:
+                    still_down.add(floor_number)
+        
+        self._pending_up = still_up
+        self._pending_down = still_down
 
 
 if __name__ == "__main__":
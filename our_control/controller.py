@@ -1,34 +1,54 @@
 #!/usr/bin/env python3
 
 import random
-from typing import List
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional
 import sys
 sys.path.append("D:/homework/soft_engineering/project/Elevator_shen")
 from elevator_saga.client.base_controller import ElevatorController
 from elevator_saga.client.proxy_models import ProxyElevator, ProxyFloor, ProxyPassenger
-from elevator_saga.core.models import Direction, SimulationEvent
+from elevator_saga.core.models import Direction, EventType, SimulationEvent
 
 
 class NewElevatorController(ElevatorController):
+    # 经过楼层、即将到达和移动事件的回调均为空实现，最频繁的这几类事件不必分发
+    IGNORED_EVENTS = frozenset({EventType.PASSING_FLOOR, EventType.ELEVATOR_APPROACHING, EventType.ELEVATOR_MOVE})
+
     def __init__(self) -> None:
         super().__init__("http://127.0.0.1:8000", False, "algorithm")  # debug=False, client_type="algorithm"
         self.max_level = 0
-        self.user_data = {}  # 记录所有乘客信息
-        self.elevator_goals = {}  # 手动维护：{elevator_id: {passenger_id: destination}}
+        self.user_data = {}  # 记录尚未完成的乘客信息，乘客下梯后即移除
+        # 乘客总数与已完成数单独计数，完成的乘客不必留在user_data中
+        self.total_passenger_count = 0
+        self.completed_passenger_count = 0
+        # 手动维护：{elevator_id: {passenger_id: destination}}
+        # 只在上下梯事件中增量更新；不能改为读取 elevator.passenger_destinations，
+        # 后者是整个tick结束后的状态，会让同一tick内先处理的停靠事件提前看到后续上梯乘客
+        self.elevator_goals = {}
+        # 每部电梯内乘客目的地的有序多重集合（允许重复楼层），与elevator_goals同步维护
+        self.goal_floors_sorted: Dict[int, List[int]] = {}
 
     def on_init(self, elevators: List[ProxyElevator], floors: List[ProxyFloor]) -> None:
         self.max_level = floors[-1].floor
 
         
-        n = len(floors)
-        self.request_queue = [[False, False] for _ in range(n)]
+        # 每层上行/下行request标记，紧凑存放：request_flags[2*floor]为上行，request_flags[2*floor+1]为下行
+        self.request_flags = bytearray(2 * len(floors))
+        # 有任一方向request的楼层，升序排列，用于二分查找最近的request楼层
+        self.request_floors_sorted: List[int] = []
+        # 楼层占用标记：每tick派遣时标记已有电梯前往的楼层，派遣结束后只清除标记过的位置
+        self.served_mask = bytearray(len(floors))
+        # 自上次派遣以来request楼层或电梯状态是否可能发生变化，未变化时派遣结果必然相同
+        self.dispatch_dirty = True
         
         self.building_floors = floors
         self.elevator_fleet = elevators
+        self.elevator_by_id = {elevator.id: elevator for elevator in elevators}
         
         # 初始化每个电梯的goals字典
         for elevator in elevators:
             self.elevator_goals[elevator.id] = {}
+            self.goal_floors_sorted[elevator.id] = []
         
         # 随机分散电梯
         for i, elevator in enumerate(elevators):
@@ -39,30 +59,42 @@ class NewElevatorController(ElevatorController):
         self, tick: int, events: List[SimulationEvent], elevators: List[ProxyElevator], floors: List[ProxyFloor]
     ) -> None:
         """每个tick开始时，随机派遣idle电梯"""
-        # 找出所有request的楼层
-        request_floors = []
-        for f in range(len(self.request_queue)):
-            if self.request_queue[f][0] or self.request_queue[f][1]:
-                request_floors.append(f)
-        
-        if not request_floors:
+        # 没有任何request时无需遍历电梯
+        if not self.request_floors_sorted:
             return
-        
-        # 获取所有非idle电梯的目标楼层
-        target_floors = set(e.target_floor for e in elevators if not e.is_idle)
-        
-        # 找出没有电梯去的request楼层
-        unserved_requests = [f for f in request_floors if f not in target_floors]
-        
-        idle_elevators = [e for e in elevators if e.is_idle]
-        for elevator in idle_elevators:
-            if unserved_requests:
-                distances = [(abs(elevator.current_floor - floor), floor) for floor in unserved_requests]
-                distances.sort()
-                target_floor = distances[0][1]
+        # 本tick没有事件（电梯与楼层状态未变）、request楼层未变且上次派遣未发出指令时，直接跳过
+        if not events and not self.dispatch_dirty:
+            return
+        self.dispatch_dirty = False
 
-                elevator.go_to_floor(target_floor)
-                unserved_requests.remove(target_floor)
+        # 一次遍历同时得到idle电梯和非idle电梯的目标楼层；
+        # 直接读取本tick缓存的电梯状态，id、所在楼层、是否空闲都只取一次，不经过代理
+        idle_elevators = []
+        target_floors = []
+        for e in self.api_client.get_state().elevators:
+            if e.is_idle:
+                idle_elevators.append((e.id, e.current_floor))
+            else:
+                target_floors.append(e.target_floor)
+
+        # 没有idle电梯时无需再统计request楼层
+        if not idle_elevators:
+            return
+
+        served = self.served_mask
+        for f in target_floors:
+            served[f] = 1
+        # 为每部idle电梯派往最近的、尚无电梯前往（含本tick已派出）的request楼层
+        for elevator_id, current_floor in idle_elevators:
+            target_floor = self._nearest_request(current_floor, served)
+            if target_floor is None:
+                break
+            self.elevator_by_id[elevator_id].go_to_floor(target_floor)
+            self.dispatch_dirty = True
+            served[target_floor] = 1
+            target_floors.append(target_floor)
+        for f in target_floors:
+            served[f] = 0
 
     def on_event_execute_end(
         self, tick: int, events: List[SimulationEvent], elevators: List[ProxyElevator], floors: List[ProxyFloor]
@@ -70,12 +102,16 @@ class NewElevatorController(ElevatorController):
         pass
 
     def on_passenger_call(self, passenger: ProxyPassenger, floor: ProxyFloor, direction: str) -> None:
-        """标记request_queue"""
+        """标记request楼层"""
         call_floor = floor.floor
-        direction_idx = 0 if direction == "up" else 1
-        self.request_queue[call_floor][direction_idx] = True
+        if direction == "up":
+            self.request_flags[2 * call_floor] = 1
+        else:
+            self.request_flags[2 * call_floor + 1] = 1
+        self._sync_request_index(call_floor)
         
         # 记录乘客信息
+        self.total_passenger_count += 1
         self.user_data[passenger.id] = {
             'origin': passenger.origin,
             'destination': passenger.destination,
@@ -88,121 +124,146 @@ class NewElevatorController(ElevatorController):
         current = elevator.current_floor
         
         # 如果当前楼层有request，优先处理
-        if self.request_queue[current][0] and current < self.max_level:  # up
+        if self.request_flags[2 * current] and current < self.max_level:  # up
             elevator.go_to_floor(current + 1)
             return
-        elif self.request_queue[current][1] and current > 0:  # down
+        elif self.request_flags[2 * current + 1] and current > 0:  # down
             elevator.go_to_floor(current - 1)
             return
         
         # 寻找其他楼层的request
-        waiting = []
-        for f in range(len(self.request_queue)):
-            if f != current and (self.request_queue[f][0] or self.request_queue[f][1]):
-                waiting.append(f)
-        
-        if waiting:
-            distances = [(abs(f - current), f) for f in waiting]
-            distances.sort()
-            target_floor = distances[0][1]
-
+        target_floor = self._nearest_other_request(current)
+        if target_floor is not None:
             elevator.go_to_floor(target_floor)
 
     def on_elevator_stopped(self, elevator: ProxyElevator, floor: ProxyFloor) -> None:
-        """停靠后：更新request_queue，然后随机选择下一个目标"""
+        """停靠后：更新request楼层，然后随机选择下一个目标"""
         current = elevator.current_floor
         direction = elevator.last_tick_direction
         
-        # 更新request_queue：直接根据floor的队列状态设置
-        self.request_queue[current][0] = len(floor.up_queue) > 0
-        self.request_queue[current][1] = len(floor.down_queue) > 0
+        # 楼层队列只读取一次，后续判断都使用局部变量
+        up_waiting = len(floor.up_queue)
+        down_waiting = len(floor.down_queue)
+        
+        # 更新request楼层：直接根据floor的队列状态设置
+        self.request_flags[2 * current] = up_waiting > 0
+        self.request_flags[2 * current + 1] = down_waiting > 0
+        self._sync_request_index(current)
         
         if len(elevator.passengers) == 0:
-            up_count = len(floor.up_queue) if current < self.max_level else 0
-            down_count = len(floor.down_queue) if current > 0 else 0
+            up_count = up_waiting if current < self.max_level else 0
+            down_count = down_waiting if current > 0 else 0
             
-            if direction == Direction.UP:
-                if up_count > 0:
-                    elevator.go_to_floor(current + 1)
-                    return
-                elif down_count > 0:
-                    elevator.go_to_floor(current - 1)
-                    return
-            elif direction == Direction.DOWN:
-                if down_count > 0:
-                    elevator.go_to_floor(current - 1)
-                    return
-                elif up_count > 0:
-                    elevator.go_to_floor(current + 1)
-                    return
-            
-            if up_count > 0 or down_count > 0:
-                if up_count > 0:
-                    elevator.go_to_floor(current + 1)
-                    return
-                elif down_count > 0:
-                    elevator.go_to_floor(current - 1)
-                    return
-            
-            request_floors = [f for f in range(len(self.request_queue)) 
-                             if f != current and (self.request_queue[f][0] or self.request_queue[f][1])]
-            if request_floors:
-                distances = [(abs(f - current), f) for f in request_floors]
-                distances.sort()
-                target = distances[0][1]
- 
+            target = self._adjacent_call_floor(current, direction, up_count, down_count)
+            if target is not None:
+                elevator.go_to_floor(target)
+                return
+
+            target = self._nearest_other_request(current)
+            if target is not None:
                 elevator.go_to_floor(target)
                 return
         
-        # 获取候选楼层
-        candidates = []
-        
-        # 1. 电梯内乘客目的地
-        my_goals = self.elevator_goals.get(elevator.id, {})
-        if my_goals:
-            dests = [d for d in my_goals.values() if d != current]
-            if direction == Direction.UP:
-                dests = [d for d in dests if d > current]
-                if dests:
-                    candidates.append(min(dests))
-            elif direction == Direction.DOWN:
-                dests = [d for d in dests if d < current]
-                if dests:
-                    candidates.append(max(dests))
-        
-        # 2. 同方向request楼层
-        request_floors = []
-        for f in range(len(self.request_queue)):
-            if self.request_queue[f][0] or self.request_queue[f][1]:
-                request_floors.append(f)
-        
-        if direction == Direction.UP:
-            above = [f for f in request_floors if f > current]
-            if above:
-                candidates.append(min(above))
-        elif direction == Direction.DOWN:
-            below = [f for f in request_floors if f < current]
-            if below:
-                candidates.append(max(below))
+        # 候选楼层最多两个，分别放在局部变量中，每次停靠不再新建候选列表
+        # 1. 方向上最近的电梯内乘客目的地；2. 同方向最近的request楼层
+        # 两者都是在有序楼层列表上沿运行方向二分查找，共用同一个方法
+        goal_candidate = self._next_in_direction(self.goal_floors_sorted[elevator.id], current, direction)
+        request_candidate = self._next_in_direction(self.request_floors_sorted, current, direction)
         
-        if candidates:
-            distances = [(abs(f - current), f) for f in candidates]
-            distances.sort()
-            target_floor = distances[0][1]
+        if goal_candidate is None:
+            target = request_candidate
+        elif request_candidate is None:
+            target = goal_candidate
+        else:
+            target = self._closer_floor(current, goal_candidate, request_candidate)
+        if target is not None:
+            elevator.go_to_floor(target)
 
-            elevator.go_to_floor(target_floor)
+    @staticmethod
+    def _adjacent_call_floor(current: int, direction: Direction, up_count: int, down_count: int) -> Optional[int]:
+        """空载电梯在本层有人等待时，按原运行方向优先（无方向时先上行）驶向相邻楼层"""
+        if direction == Direction.DOWN and down_count > 0:
+            return current - 1
+        if up_count > 0:
+            return current + 1
+        if down_count > 0:
+            return current - 1
+        return None
+
+    def _sync_request_index(self, floor: int) -> None:
+        """上下行标记更新完后调用一次，在楼层有无request发生变化时维护有序列表"""
+        has_request = self.request_flags[2 * floor] or self.request_flags[2 * floor + 1]
+        sorted_floors = self.request_floors_sorted
+        i = bisect_left(sorted_floors, floor)
+        listed = i < len(sorted_floors) and sorted_floors[i] == floor
+        if has_request and not listed:
+            sorted_floors.insert(i, floor)
+            self.dispatch_dirty = True
+        elif listed and not has_request:
+            del sorted_floors[i]
+            self.dispatch_dirty = True
+
+    def _nearest_request(self, current: int, served: bytearray) -> Optional[int]:
+        """二分定位current，向两侧跳过served中已标记的楼层，返回最近的request楼层；距离相同时取较低楼层"""
+        sorted_floors = self.request_floors_sorted
+        hi = bisect_left(sorted_floors, current)
+        lo = hi - 1
+        while hi < len(sorted_floors) and served[sorted_floors[hi]]:
+            hi += 1
+        while lo >= 0 and served[sorted_floors[lo]]:
+            lo -= 1
+        return self._closer_of(current, sorted_floors, lo, hi)
+
+    def _nearest_other_request(self, current: int) -> Optional[int]:
+        """除current本层外最近的request楼层；距离相同时取较低楼层"""
+        sorted_floors = self.request_floors_sorted
+        lo = bisect_left(sorted_floors, current) - 1
+        hi = bisect_right(sorted_floors, current)
+        return self._closer_of(current, sorted_floors, lo, hi)
+
+    @staticmethod
+    def _closer_of(current: int, sorted_floors: List[int], lo: int, hi: int) -> Optional[int]:
+        """在下侧候选sorted_floors[lo]与上侧候选sorted_floors[hi]中取离current更近者，越界表示该侧没有候选"""
+        if hi < len(sorted_floors) and (lo < 0 or sorted_floors[hi] - current < current - sorted_floors[lo]):
+            return sorted_floors[hi]
+        return sorted_floors[lo] if lo >= 0 else None
+
+    @staticmethod
+    def _closer_floor(current: int, a: int, b: int) -> int:
+        """a、b中距离current较近的楼层，距离相同时取较低楼层"""
+        distance_a = a - current if a > current else current - a
+        distance_b = b - current if b > current else current - b
+        if distance_a < distance_b or (distance_a == distance_b and a < b):
+            return a
+        return b
+
+    @staticmethod
+    def _next_in_direction(sorted_floors: List[int], current: int, direction: Direction) -> Optional[int]:
+        """沿运行方向在有序楼层列表中二分查找current之外最近的楼层，电梯无方向时返回None"""
+        if direction == Direction.UP:
+            i = bisect_right(sorted_floors, current)
+            return sorted_floors[i] if i < len(sorted_floors) else None
+        if direction == Direction.DOWN:
+            i = bisect_left(sorted_floors, current)
+            return sorted_floors[i - 1] if i > 0 else None
+        return None
 
     def on_passenger_board(self, elevator: ProxyElevator, passenger: ProxyPassenger) -> None:
         # 记录乘客目的地
-        self.elevator_goals[elevator.id][passenger.id] = passenger.destination
+        destination = passenger.destination
+        self.elevator_goals[elevator.id][passenger.id] = destination
+        insort(self.goal_floors_sorted[elevator.id], destination)
 
     def on_passenger_alight(self, elevator: ProxyElevator, passenger: ProxyPassenger, floor: ProxyFloor) -> None:
-        # 标记乘客完成
-        if passenger.id in self.user_data:
-            self.user_data[passenger.id]['completed'] = True
+        # 乘客完成：移除记录并计数
+        if self.user_data.pop(passenger.id, None) is not None:
+            self.completed_passenger_count += 1
         
         # 移除乘客目的地记录
-        self.elevator_goals[elevator.id].pop(passenger.id, None)
+        destination = self.elevator_goals[elevator.id].pop(passenger.id, None)
+        if destination is not None:
+            goal_floors = self.goal_floors_sorted[elevator.id]
+            del goal_floors[bisect_left(goal_floors, destination)]
 
     def on_elevator_passing_floor(self, elevator: ProxyElevator, floor: ProxyFloor, direction: str) -> None:
         pass
@@ -5,18 +5,138 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
+import multiprocessing
+import queue
 import threading
+import time
 import sys
-from typing import List
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 # 添加项目路径
 sys.path.append("D:/homework/soft_engineering/project/Elevator_shen")
 
-from elevator_saga.client.proxy_models import ProxyElevator, ProxyFloor
 from elevator_saga.core.models import Direction
 from our_control.controller import NewElevatorController
 
 
+@dataclass(slots=True)
+class ElevatorVisualState:
+    """电梯上一次绘制时的状态，用于判断是否需要更新电梯文本"""
+    is_idle: bool
+    direction: Direction
+    passenger_count: int
+    current_floor: int
+
+
+class ElevatorSnapshot(NamedTuple):
+    """单部电梯的显示数据"""
+    id: int
+    current_floor: int
+    current_floor_float: float
+    target_floor: int
+    is_idle: bool
+    direction: Direction
+    passenger_count: int
+
+
+class FloorSnapshot(NamedTuple):
+    """单个楼层的等待人数"""
+    floor: int
+    up_count: int
+    down_count: int
+
+
+class RenderSnapshot(NamedTuple):
+    """一次更新时界面所需的全部数据，在控制器进程中一次性读取；
+    渲染时只读快照，不再访问代理对象和控制器，避免跨线程读到更新了一半的状态"""
+    elevators: Tuple[ElevatorSnapshot, ...]
+    floors: Tuple[FloorSnapshot, ...]
+    stats: Optional[Tuple[int, int]]  # (乘客总数, 已完成数)，控制器不提供统计时为None
+
+
+def build_render_snapshot(elevators, floors, controller):
+    """读取界面上显示的所有电梯、楼层和统计数据，既用于判断是否需要重绘，也是渲染的唯一数据来源"""
+    elevator_snapshots = []
+    for elevator in elevators:
+        current_floor = getattr(elevator, 'current_floor', 0)
+        elevator_snapshots.append(
+            ElevatorSnapshot(
+                id=elevator.id,
+                current_floor=current_floor,
+                current_floor_float=getattr(elevator, 'current_floor_float', current_floor),
+                target_floor=getattr(elevator, 'target_floor', current_floor),
+                is_idle=getattr(elevator, 'is_idle', True),
+                direction=getattr(elevator, 'last_tick_direction', Direction.STOPPED),
+                passenger_count=len(getattr(elevator, 'passengers', [])),
+            )
+        )
+    floor_snapshots = tuple(
+        FloorSnapshot(
+            getattr(floor, 'floor', 0), len(getattr(floor, 'up_queue', [])), len(getattr(floor, 'down_queue', []))
+        )
+        for floor in floors
+    )
+    if hasattr(controller, 'completed_passenger_count'):
+        stats = (controller.total_passenger_count, controller.completed_passenger_count)
+    else:
+        stats = None
+    return RenderSnapshot(tuple(elevator_snapshots), floor_snapshots, stats)
+
+
+def run_controller_process(updates, stop_event):
+    """控制器子进程入口：调度算法在独立进程中运行，不与界面主线程争用GIL；
+    每次回调后把界面所需数据整理成快照放入updates队列，渲染数据未变时只发送tick。
+    队列中的消息为(类型, tick, 快照)，类型为'init'、'update'或'finished'"""
+    controller = None
+    try:
+        controller = NewElevatorController()
+        last_snapshot = None
+        
+        def publish(kind, elevators, floors, tick):
+            nonlocal last_snapshot
+            # GUI进程通过stop_event请求停止；每次回调时检查，不在子进程中阻塞等待该信号
+            if stop_event.is_set():
+                controller.stop()
+            snapshot = build_render_snapshot(elevators, floors, controller)
+            if kind == 'init' or snapshot != last_snapshot:
+                last_snapshot = snapshot
+                updates.put((kind, tick, snapshot))
+            else:
+                updates.put((kind, tick, None))
+        
+        # 保存原始方法，包装后只追加快照发送，完全不干扰算法
+        original_on_init = controller.on_init
+        original_on_event_execute_start = controller.on_event_execute_start
+        original_on_event_execute_end = controller.on_event_execute_end
+        
+        def gui_on_init(elevators, floors):
+            result = original_on_init(elevators, floors)
+            publish('init', elevators, floors, getattr(controller, 'current_tick', 0))
+            return result
+        
+        def gui_on_event_execute_start(tick, events, elevators, floors):
+            result = original_on_event_execute_start(tick, events, elevators, floors)
+            publish('update', elevators, floors, tick)
+            return result
+        
+        def gui_on_event_execute_end(tick, events, elevators, floors):
+            result = original_on_event_execute_end(tick, events, elevators, floors)
+            publish('update', elevators, floors, tick)
+            return result
+        
+        controller.on_init = gui_on_init
+        controller.on_event_execute_start = gui_on_event_execute_start
+        controller.on_event_execute_end = gui_on_event_execute_end
+        controller.start()
+    except Exception as e:
+        print(f"控制器运行错误: {e}")
+    finally:
+        updates.put(('finished', getattr(controller, 'current_tick', 0), None))
+
+
 class ElevatorGUI:
     """电梯可视化GUI界面 - 包装现有的NewElevatorController"""
     
@@ -25,19 +145,27 @@ class ElevatorGUI:
         self.root.title("电梯调度可视化系统")
         self.root.geometry("1400x900")
         
-        # 数据存储
-        self.elevators: List[ProxyElevator] = []
-        self.floors: List[ProxyFloor] = []
+        # 数据存储：最近一次从控制器进程收到的电梯和楼层快照
+        self.elevators: Tuple[ElevatorSnapshot, ...] = ()
+        self.floors: Tuple[FloorSnapshot, ...] = ()
         self.current_tick = 0
         self.is_running = False
         
-        # 控制器引用
-        self.controller = None
+        # 控制器子进程及与其通信的更新队列、停止信号
+        self.controller_process = None
+        self._controller_updates = None
+        self._stop_event = None
         
         # 可视化元素存储
         self.elevator_rects = {}  # 存储电梯矩形ID
+        self.elevator_texts: Dict[int, Tuple[int, int, int]] = {}  # 存储电梯内(编号, 乘客数, 楼层)文字的图元ID
         self.passenger_indicators = {}  # 存储乘客指示器
-        self.elevator_states = {}  # 存储电梯状态缓存，避免频繁重绘
+        self.elevator_states: Dict[int, ElevatorVisualState] = {}  # 存储电梯状态缓存，避免频繁重绘
+        # 各电梯图元当前在画布上的位置（矩形左上角），移动时据此计算位移，无需向Tk查询坐标
+        self.elevator_positions: Dict[int, Tuple[float, float]] = {}
+        # 各电梯上次绘制时的快照，与本次相同的电梯整体跳过
+        self.rendered_elevators: Dict[int, ElevatorSnapshot] = {}
+        self._last_elevator_count = None  # 上一帧的电梯数量，None表示尚未绘制过
         
         # 可视化参数
         self.floor_height = 60
@@ -48,9 +176,33 @@ class ElevatorGUI:
         self.canvas_width = 800
         self.canvas_height = 600
         
+        # 电梯动画：渲染只更新各电梯的目标Y坐标，由约60fps的动画循环逐帧平移到目标位置
+        self.elevator_target_y: Dict[int, float] = {}
+        self.animation_interval_ms = 16
+        self.animation_min_step = self.floor_height / 4  # 每帧最少可移动的像素数
+        self._animating = False  # 动画循环是否在运行，所有电梯到位后停止
+        
         # 动态电梯参数（根据电梯数量调整）
         self.elevator_width = self.base_elevator_width
         self.elevator_height = self.base_elevator_height
+        # 电梯布局（只随电梯数量变化）：每部电梯的X坐标，以及位于0层时的Y坐标
+        self.elevator_x: List[int] = []
+        self.elevator_base_y = self.canvas_height - self.floor_height - self.elevator_height
+        
+        # 渲染节流：转发线程只标记dirty并唤醒主线程，主线程等待一个间隔（上限约30fps）后合并重绘；
+        # 没有更新时主线程不做任何轮询
+        self.render_interval_ms = 33
+        self._wakeup_pending = False  # 已唤醒主线程、尚未渲染，期间的更新不再重复唤醒
+        self._dirty = False  # 数据已更新、界面待重绘
+        self._building_dirty = False  # 建筑物待绘制（初始化后只需一次）
+        self._tick_dirty = False  # 只有tick变化、其余渲染状态不变
+        self._last_snapshot = None  # 上次重绘时的渲染状态快照
+        self._controller_finished = False  # 控制器进程已退出，待主线程收尾
+        # 保护转发线程与主线程之间交接的快照和dirty标记：主线程“读取并清除”标记是复合操作，
+        # 不加锁时可能清掉转发线程刚设置的标记而漏掉一次重绘；在无GIL（free-threaded）的Python下同样成立
+        self._render_lock = threading.Lock()
+        self._label_texts = {}  # 各文字标签当前显示的内容，内容不变时不再调用config
+        self._fonts: Dict[tuple, tkfont.Font] = {}  # 按(字号, 是否加粗)缓存的字体对象
         
         # 设置快捷键
         # self.setup_shortcuts()
@@ -61,6 +213,9 @@ class ElevatorGUI:
         # 更新线程
         self.update_thread = None
         
+        # 转发线程通过虚拟事件唤醒主线程渲染
+        self.root.bind('<<RenderRequest>>', self._on_render_request)
+        
     def calculate_elevator_params(self, num_elevators):
         """根据电梯数量计算电梯参数"""
         if num_elevators <= 0:
@@ -86,8 +241,23 @@ class ElevatorGUI:
         
         return int(width), int(height)
         
+    def setup_styles(self):
+        """集中定义各标签的ttk样式：字体和颜色只在样式中配置一次，控件按样式名引用"""
+        style = ttk.Style(self.root)
+        style.configure('Value.TLabel', font=self.get_font(12, bold=True))
+        style.configure('Stat.TLabel', font=self.get_font(10, bold=True))
+        style.configure('RowTitle.TLabel', font=self.get_font(10, bold=True))
+        style.configure('FloorTitle.TLabel', font=self.get_font(9, bold=True))
+        style.configure('Up.TLabel', foreground="blue")
+        style.configure('Down.TLabel', foreground="red")
+        style.configure('Idle.TLabel', foreground="green")
+        style.configure('Busy.TLabel', foreground="red")
+        style.configure('Waiting.TLabel', foreground="orange")
+        
     def setup_ui(self):
         """设置用户界面"""
+        self.setup_styles()
+        
         # 主框架
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -138,11 +308,11 @@ class ElevatorGUI:
         status_frame.pack(fill=tk.X, pady=(10, 0))
         
         ttk.Label(status_frame, text="当前Tick:").pack()
-        self.tick_label = ttk.Label(status_frame, text="0", font=("Arial", 12, "bold"))
+        self.tick_label = ttk.Label(status_frame, text="0", style='Value.TLabel')
         self.tick_label.pack()
         
         ttk.Label(status_frame, text="状态:").pack(pady=(5, 0))
-        self.status_label = ttk.Label(status_frame, text="未启动", font=("Arial", 12, "bold"))
+        self.status_label = ttk.Label(status_frame, text="未启动", style='Value.TLabel')
         self.status_label.pack()
         
     def setup_elevator_panel(self, parent):
@@ -211,7 +381,7 @@ class ElevatorGUI:
             frame.pack(fill=tk.X, pady=2)
             
             ttk.Label(frame, text=f"{label_text}:").pack(side=tk.LEFT)
-            self.stats_labels[key] = ttk.Label(frame, text="0", font=("Arial", 10, "bold"))
+            self.stats_labels[key] = ttk.Label(frame, text="0", style='Stat.TLabel')
             self.stats_labels[key].pack(side=tk.RIGHT)
     
     def setup_visualization_panel(self, parent):
@@ -226,6 +396,7 @@ class ElevatorGUI:
         
         # 电梯矩形对象
         self.elevator_rects = {}
+        self.elevator_texts = {}
         self.floor_lines = {}
         self.passenger_indicators = {}
         
@@ -236,21 +407,31 @@ class ElevatorGUI:
             return
             
         try:
-            # 创建控制器 - 使用algorithm类型而不是gui类型
-            self.controller = NewElevatorController()
-            
-            # 为控制器添加GUI回调功能
-            self.add_gui_callbacks()
-            print("GUI回调已添加")
+            # 控制器在spawn方式启动的子进程中运行，GUI进程只接收渲染快照
+            ctx = multiprocessing.get_context('spawn')
+            self._controller_updates = ctx.Queue()
+            self._stop_event = ctx.Event()
+            process = ctx.Process(
+                target=run_controller_process, args=(self._controller_updates, self._stop_event), daemon=True
+            )
+            # 换上本次运行的进程后，上一次运行残留的转发线程发来的更新和结束标记都会被忽略
+            with self._render_lock:
+                self.controller_process = process
+                self._last_snapshot = None
+                self._controller_finished = False
             
-            # 启动控制器线程
             self.is_running = True
             self.start_btn.config(state=tk.DISABLED)
             self.stop_btn.config(state=tk.NORMAL)
             self.status_label.config(text="运行中")
             
-            # 在新线程中运行控制器
-            self.update_thread = threading.Thread(target=self.run_controller, daemon=True)
+            self.controller_process.start()
+            # 转发线程把子进程的更新交给主线程渲染
+            self.update_thread = threading.Thread(
+                target=self.forward_controller_updates,
+                args=(self._controller_updates, self.controller_process),
+                daemon=True,
+            )
             self.update_thread.start()
             print("模拟启动成功")
             
@@ -262,137 +443,209 @@ class ElevatorGUI:
             self.stop_btn.config(state=tk.DISABLED)
             self.status_label.config(text="启动失败")
     
-    def add_gui_callbacks(self):
-        """为现有控制器添加GUI回调功能 - 完全不干扰算法"""
-        if not self.controller:
-            return
-            
-        # 保存原始方法
-        original_on_init = self.controller.on_init
-        original_on_event_execute_start = self.controller.on_event_execute_start
-        original_on_event_execute_end = self.controller.on_event_execute_end
-        
-        def gui_on_init(elevators, floors):
-            """带GUI回调的初始化"""
-            result = original_on_init(elevators, floors)
-            current_tick = getattr(self.controller, 'current_tick', 0)
-            self.update_display(elevators, floors, current_tick)
-            # 只在初始化时绘制建筑物
-            self.draw_building()
-            return result
-            
-        def gui_on_event_execute_start(tick, events, elevators, floors):
-            """带GUI回调的事件执行前"""
-            result = original_on_event_execute_start(tick, events, elevators, floors)
-            self.update_display(elevators, floors, tick)
-            return result
-            
-        def gui_on_event_execute_end(tick, events, elevators, floors):
-            """带GUI回调的事件执行后"""
-            result = original_on_event_execute_end(tick, events, elevators, floors)
-            self.update_display(elevators, floors, tick)
-            self.update_visualization()
-            return result
-        
-        # 替换方法
-        self.controller.on_init = gui_on_init
-        self.controller.on_event_execute_start = gui_on_event_execute_start
-        self.controller.on_event_execute_end = gui_on_event_execute_end
-        
-    def stop_simulation(self):
-        """停止模拟"""
+    def stop_simulation(self, on_stopped=None):
+        """停止模拟：通知控制器停止后不阻塞主线程，控制器进程退出后再恢复按钮并调用on_stopped"""
         if not self.is_running:
             return
             
         print("正在停止模拟...")
         self.is_running = False
         
-        if self.controller:
-            try:
-                self.controller.stop()
-                print("控制器已停止")
-            except Exception as e:
-                print(f"停止控制器时出错: {e}")
+        if self._stop_event is not None:
+            self._stop_event.set()
+            print("已通知控制器停止")
         
-        # 等待线程结束
-        if hasattr(self, 'update_thread') and self.update_thread and self.update_thread.is_alive():
+        # 等待线程结束：用after轮询代替join，等待期间界面保持响应
+        self.stop_btn.config(state=tk.DISABLED)
+        if self.update_thread and self.update_thread.is_alive():
             print("等待线程结束...")
-            self.update_thread.join(timeout=2.0)
-            
+            self.status_label.config(text="正在停止")
+        self._wait_for_controller_exit(time.monotonic() + 2.0, on_stopped)
+    
+    def _wait_for_controller_exit(self, deadline, on_stopped):
+        """每50ms检查一次转发线程，控制器进程结束后该线程退出；超过deadline时强制结束控制器进程后完成停止"""
+        if self.update_thread and self.update_thread.is_alive():
+            if time.monotonic() < deadline:
+                self.root.after(50, self._wait_for_controller_exit, deadline, on_stopped)
+                return
+            print("控制器进程未在超时前退出，强制结束")
+            if self.controller_process is not None and self.controller_process.is_alive():
+                self.controller_process.terminate()
+        
         self.start_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
         self.status_label.config(text="已停止")
         print("模拟已停止")
+        if on_stopped is not None:
+            on_stopped()
         
     def reset_simulation(self):
-        """重置模拟"""
-        self.stop_simulation()
-        
-        # 清理数据
-        self.elevators = []
-        self.floors = []
-        self.current_tick = 0
-        
-        # 清理控制器
-        self.controller = None
-        
-        # 清理画布
-        self.canvas.delete("all")
-        
-        # 清理电梯矩形字典和状态缓存
-        self.elevator_rects = {}
-        self.elevator_states = {}
-        
-        # 更新显示
-        self.update_display()
-        
-        # 重置按钮状态
-        self.start_btn.config(state=tk.NORMAL)
-        self.stop_btn.config(state=tk.DISABLED)
-        self.status_label.config(text="已重置")
+        """重置模拟：运行中时先异步停止，控制器进程退出后再清理"""
+        if self.is_running:
+            self.stop_simulation(on_stopped=self._finish_reset)
+        else:
+            self._finish_reset()
+    
+    def _finish_reset(self):
+        """清理模拟数据和画布，恢复初始界面"""
+        # 清理和按钮状态的所有界面修改合并为一次刷新，中间状态不单独绘制
+        with self.batch_ui():
+            # 清理数据
+            self.elevators = ()
+            self.floors = ()
+            self.current_tick = 0
+            
+            # 清理控制器进程
+            with self._render_lock:
+                self.controller_process = None
+            self._controller_updates = None
+            self._stop_event = None
+            
+            # 清理画布
+            self.canvas.delete("all")
+            
+            # 清理电梯矩形字典、乘客指示器和状态缓存
+            self.elevator_rects = {}
+            self.elevator_texts = {}
+            self.passenger_indicators = {}
+            self.elevator_states = {}
+            self.elevator_positions = {}
+            self.rendered_elevators = {}
+            self.elevator_target_y = {}
+            self._last_snapshot = None
+            
+            # 重置按钮状态
+            self.start_btn.config(state=tk.NORMAL)
+            self.stop_btn.config(state=tk.DISABLED)
+            self.status_label.config(text="已重置")
         
         print("模拟已重置，可以重新启动")
             
-    def run_controller(self):
-        """运行控制器"""
+    def forward_controller_updates(self, updates, process):
+        """转发线程：接收控制器进程的更新并唤醒主线程渲染，子进程结束后通知主线程收尾；
+        process标识线程所属的运行，进程已不是当前控制器进程时，更新和结束标记都不再生效"""
         try:
-            if self.controller:
-                self.controller.start()
-        except Exception as e:
-            print(f"控制器运行错误: {e}")
+            while True:
+                try:
+                    kind, tick, snapshot = updates.get(timeout=0.5)
+                except queue.Empty:
+                    # 子进程异常退出时不会发送'finished'
+                    if not process.is_alive():
+                        break
+                    continue
+                if kind == 'finished':
+                    break
+                self.update_display(process, kind, tick, snapshot)
         finally:
-            self.is_running = False
-            self.root.after(0, lambda: self.stop_simulation())
+            # 转发线程不直接修改界面，只留下标记并唤醒主线程，由渲染时调用stop_simulation收尾
+            with self._render_lock:
+                current_run = process is self.controller_process
+                if current_run:
+                    self._controller_finished = True
+            if current_run:
+                self._request_render()
     
-    def update_display(self, elevators=None, floors=None, tick=None):
-        """更新显示"""
+    def update_display(self, process, kind, tick, snapshot):
+        """记录控制器进程process的一次更新：snapshot为None表示渲染数据未变，只需刷新tick显示"""
         if not self.is_running:
             return
             
-        # 更新数据
-        if elevators is not None:
-            self.elevators = elevators
-        if floors is not None:
-            self.floors = floors
-        if tick is not None:
+        # 只标记待重绘，由主线程渲染循环合并处理，不再每次更新都投递一次重绘
+        with self._render_lock:
+            if process is not self.controller_process:
+                return
             self.current_tick = tick
-            
-        # 在主线程中更新UI
-        self.root.after(0, self._update_ui)
+            if kind == 'init':
+                # 只在初始化时绘制建筑物
+                self._building_dirty = True
+            if snapshot is not None:
+                self.elevators = snapshot.elevators
+                self.floors = snapshot.floors
+                self._last_snapshot = snapshot
+                self._dirty = True
+            else:
+                self._tick_dirty = True
+        self._request_render()
+    
+    def _request_render(self):
+        """转发线程调用：界面有待处理的更新时向主线程投递一次唤醒事件，主线程渲染前的后续更新不再重复投递"""
+        with self._render_lock:
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+        try:
+            # event_generate会被转交给主线程的Tcl解释器执行，when='tail'表示排入事件队列末尾
+            self.root.event_generate('<<RenderRequest>>', when='tail')
+        except (RuntimeError, tk.TclError):
+            # 窗口已关闭或主循环已退出，无需再渲染
+            pass
+    
+    def _on_render_request(self, event=None):
+        """主线程收到唤醒后等待一个渲染间隔再绘制，合并这段时间内控制器进程的所有更新"""
+        self.root.after(self.render_interval_ms, self._render_tick)
     
-    def _update_ui(self):
-        """更新UI元素"""
+    def _render_tick(self):
+        """主线程渲染：两次渲染之间的多次数据更新只重绘一次"""
+        # 在锁内一次取走待处理的标记和快照，绘制时不持有锁，不阻塞转发线程；
+        # 快照整体替换，本帧只取一次引用，转发线程随后的更新不会影响本帧。
+        # 同时清除唤醒标记，此后转发线程的更新会重新唤醒主线程
+        with self._render_lock:
+            self._wakeup_pending = False
+            controller_finished, self._controller_finished = self._controller_finished, False
+            building_dirty, self._building_dirty = self._building_dirty, False
+            dirty, self._dirty = self._dirty, False
+            tick_dirty, self._tick_dirty = self._tick_dirty, False
+            snapshot = self._last_snapshot
+        if controller_finished:
+            self.stop_simulation()
+        dirty = dirty and snapshot is not None
+        if building_dirty or dirty:
+            # 本帧的所有控件和画布修改完成后统一刷新一次
+            with self.batch_ui():
+                if building_dirty:
+                    self.draw_building()
+                if dirty:
+                    self._update_ui(snapshot)
+                    self.update_visualization(snapshot)
+        elif tick_dirty:
+            self.set_label_text('tick', self.tick_label, str(self.current_tick))
+    
+    @contextmanager
+    def batch_ui(self):
+        """批量修改界面：块内的修改只在结束时通过一次update_idletasks完成重绘"""
+        try:
+            yield
+        finally:
+            self.root.update_idletasks()
+    
+    def get_font(self, size, bold=False):
+        """返回共用的字体对象：每种字号/字重只创建一次，各图元和控件引用同一对象，不再逐次解析字体描述"""
+        key = (size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(root=self.root, family="Arial", size=size, weight="bold" if bold else "normal")
+            self._fonts[key] = font
+        return font
+    
+    def set_label_text(self, key, label, text):
+        """只在显示内容变化时更新标签，避免无谓的控件重绘"""
+        if self._label_texts.get(key) != text:
+            self._label_texts[key] = text
+            label.config(text=text)
+    
+    def _update_ui(self, snapshot):
+        """按快照更新UI元素"""
         # 更新tick显示
-        self.tick_label.config(text=str(self.current_tick))
+        self.set_label_text('tick', self.tick_label, str(self.current_tick))
         
         # 更新电梯状态
-        self.update_elevator_display()
+        self.update_elevator_display(snapshot.elevators)
         
         # 更新楼层状态
-        self.update_floor_display()
+        self.update_floor_display(snapshot.floors)
         
         # 更新统计信息
-        self.update_stats_display()
+        self.update_stats_display(snapshot.stats)
     
     def draw_building(self):
         """绘制建筑物 - 美化版本，只在初始化时调用"""
@@ -403,11 +656,18 @@ class ElevatorGUI:
         self.canvas.delete("background")
         self.canvas.delete("floor")
         
-        # 绘制背景渐变效果
-        for i in range(self.canvas_height):
-            color_intensity = int(255 - (i / self.canvas_height) * 50)
-            color = f"#{color_intensity:02x}{color_intensity:02x}{255:02x}"
-            self.canvas.create_line(0, i, self.canvas_width, i, fill=color, width=1, tags="background")
+        # 绘制背景渐变效果：颜色相同的连续像素行合并为一个矩形，图元数由画布高度（600）降为颜色级数（约50）
+        band_start = 0
+        band_intensity = 255
+        for i in range(1, self.canvas_height + 1):
+            color_intensity = int(255 - (i / self.canvas_height) * 50) if i < self.canvas_height else None
+            if color_intensity == band_intensity:
+                continue
+            color = f"#{band_intensity:02x}{band_intensity:02x}{255:02x}"
+            self.canvas.create_rectangle(
+                0, band_start, self.canvas_width, i, fill=color, outline="", tags="background"
+            )
+            band_start, band_intensity = i, color_intensity
         
         # 绘制楼层线
         for floor in self.floors:
@@ -431,7 +691,7 @@ class ElevatorGUI:
                 fill="#2196F3", outline="#1976D2", width=2, tags="floor"
             )
             self.canvas.create_text(20, y - 15, text=f"F{floor.floor + 1}", 
-                                   font=("Arial", 12, "bold"), fill="white", tags="floor")
+                                   font=self.get_font(12, bold=True), fill="white", tags="floor")
             
             # 绘制楼层装饰线
             self.canvas.create_line(40, y - 15, 100, y - 15, fill="#BDBDBD", width=1, tags="floor")
@@ -440,176 +700,210 @@ class ElevatorGUI:
             separator_x = self.canvas_width - 200
             self.canvas.create_line(separator_x, y - self.floor_height + 5, separator_x, y - 5, 
                                    fill="#E0E0E0", width=1, dash=(5, 5), tags="floor")
+        
+        # 电梯和乘客图元常驻画布，建筑物重绘后需压到它们下方
+        self.canvas.tag_lower("floor")
+        self.canvas.tag_lower("background")
     
-    def update_visualization(self):
-        """更新可视化 - 平滑动画，只更新电梯位置"""
-        if not self.elevators or not self.floors:
+    def update_visualization(self, snapshot):
+        """按快照更新可视化 - 平滑动画，只更新电梯位置"""
+        if not snapshot.elevators or not snapshot.floors:
             return
             
         # 检查电梯数量是否发生变化，如果变化则重新创建所有电梯
-        current_elevator_count = len(self.elevators)
-        if hasattr(self, '_last_elevator_count') and self._last_elevator_count != current_elevator_count:
+        current_elevator_count = len(snapshot.elevators)
+        if self._last_elevator_count is not None and self._last_elevator_count != current_elevator_count:
             # 电梯数量发生变化，清理现有电梯并重新创建
             self.canvas.delete("elevator")
             self.elevator_rects = {}
+            self.elevator_texts = {}
             self.elevator_states = {}
+            self.elevator_positions = {}
+            self.rendered_elevators = {}
+            self.elevator_target_y = {}
+        if self._last_elevator_count != current_elevator_count:
+            self.layout_elevators(current_elevator_count)
         
         self._last_elevator_count = current_elevator_count
             
         # 只更新电梯位置，不清除现有元素
-        for i, elevator in enumerate(self.elevators):
+        # 只处理显示数据发生变化的电梯：未变化的电梯不计算位置、不构造状态、不访问画布
+        rendered = self.rendered_elevators
+        for i, elevator in enumerate(snapshot.elevators):
+            if rendered.get(elevator.id) == elevator:
+                continue
+            rendered[elevator.id] = elevator
             self.update_elevator_position(elevator, i)
             
         # 更新楼层等待乘客显示
-        self.update_floor_passengers_display()
+        self.update_floor_passengers_display(snapshot.floors)
     
-    def update_floor_passengers_display(self):
-        """更新楼层等待乘客显示 - 只更新，不重绘整个建筑物"""
-        if not self.floors:
+    def update_floor_passengers_display(self, floors):
+        """更新楼层等待乘客显示 - 图元首次使用时创建并常驻，之后只切换显示状态和文字"""
+        # 为每个楼层更新上行、下行等待乘客
+        for floor in floors:
+            self.update_queue_indicator(floor.floor, "up", floor.up_count)
+            self.update_queue_indicator(floor.floor, "down", floor.down_count)
+    
+    def update_queue_indicator(self, floor_num, direction, count):
+        """按等待人数显示/隐藏常驻的乘客图元，人数未变时不做任何画布操作"""
+        indicator = self.passenger_indicators.get((floor_num, direction))
+        if indicator is None:
+            indicator = self.create_queue_indicator(floor_num, direction)
+            self.passenger_indicators[(floor_num, direction)] = indicator
+        previous = indicator['count']
+        if previous == count:
             return
-            
-        # 清除旧的乘客指示器
-        self.canvas.delete("queue_text")
-        self.canvas.delete("queue_icon")
-        self.canvas.delete("more_indicator")
-        
-        # 为每个楼层绘制等待乘客
-        for floor in self.floors:
-            self.draw_floor_passengers_for_floor(floor)
+        indicator['count'] = count
+        
+        if bool(previous) != bool(count):
+            self.canvas.itemconfig(indicator['label'], state=tk.NORMAL if count else tk.HIDDEN)
+        
+        # 最多显示5个乘客圆点，只切换显示数量变化所涉及的圆点
+        previous_shown, shown = min(5, previous), min(5, count)
+        state = tk.NORMAL if shown > previous_shown else tk.HIDDEN
+        for icon in indicator['icons'][min(previous_shown, shown):max(previous_shown, shown)]:
+            self.canvas.itemconfig(icon, state=state)
+        
+        # 更多乘客指示器
+        more_bg, more_text = indicator['more']
+        if count > 5:
+            if previous <= 5:
+                self.canvas.itemconfig(more_bg, state=tk.NORMAL)
+            self.canvas.itemconfig(more_text, state=tk.NORMAL, text=f"+{count - 5}")
+        elif previous > 5:
+            self.canvas.itemconfig(more_bg, state=tk.HIDDEN)
+            self.canvas.itemconfig(more_text, state=tk.HIDDEN)
     
-    def draw_floor_passengers_for_floor(self, floor):
-        """为单个楼层绘制等待乘客"""
-        floor_num = getattr(floor, 'floor', 0)
+    def create_queue_indicator(self, floor_num, direction):
+        """创建单个楼层单个方向的等待乘客图元（初始隐藏）：每名乘客只用一个圆点图元，不再叠加文字图标"""
         y = self.canvas_height - (floor_num + 1) * self.floor_height
         
         # 计算乘客等待状态显示区域（电梯右侧）
         passenger_area_start = self.canvas_width - 200  # 从右侧200像素开始
         
-        # 绘制上行等待乘客
-        up_queue = getattr(floor, 'up_queue', [])
-        if up_queue:
-            # 上行乘客标签
-            self.canvas.create_text(passenger_area_start + 20, y - 25, text="↑ 上行", font=("Arial", 9, "bold"), fill="#2196F3", tags="queue_text")
-            
-            for i in range(min(5, len(up_queue))):  # 最多显示5个
-                x = passenger_area_start + 20 + i * 18
-                # 乘客图标背景
-                self.canvas.create_oval(x - 6, y - 16, x + 6, y - 4, 
-                                       fill="#E3F2FD", outline="#2196F3", width=2, tags="queue_icon")
-                self.canvas.create_text(x, y - 10, text="👤", font=("Arial", 8), tags="queue_icon")
-                
-            if len(up_queue) > 5:
-                # 更多乘客指示器
-                more_x = passenger_area_start + 20 + 5 * 18 + 10
-                self.canvas.create_oval(more_x - 8, y - 16, more_x + 8, y - 4,
-                                       fill="#FF9800", outline="#F57C00", width=2, tags="more_indicator")
-                self.canvas.create_text(more_x, y - 10, text=f"+{len(up_queue)-5}", 
-                                       font=("Arial", 8, "bold"), fill="white", tags="more_indicator")
-        
-        # 绘制下行等待乘客
-        down_queue = getattr(floor, 'down_queue', [])
-        if down_queue:
-            # 下行乘客标签
-            self.canvas.create_text(passenger_area_start + 20, y - 35, text="↓ 下行", font=("Arial", 9, "bold"), fill="#F44336", tags="queue_text")
-            
-            for i in range(min(5, len(down_queue))):  # 最多显示5个
-                x = passenger_area_start + 20 + i * 18
-                # 乘客图标背景
-                self.canvas.create_oval(x - 6, y - 26, x + 6, y - 14, 
-                                       fill="#FFEBEE", outline="#F44336", width=2, tags="queue_icon")
-                self.canvas.create_text(x, y - 20, text="👤", font=("Arial", 8), tags="queue_icon")
-                
-            if len(down_queue) > 5:
-                # 更多乘客指示器
-                more_x = passenger_area_start + 20 + 5 * 18 + 10
-                self.canvas.create_oval(more_x - 8, y - 26, more_x + 8, y - 14,
-                                       fill="#FF9800", outline="#F57C00", width=2, tags="more_indicator")
-                self.canvas.create_text(more_x, y - 20, text=f"+{len(down_queue)-5}", 
-                                       font=("Arial", 8, "bold"), fill="white", tags="more_indicator")
+        if direction == "up":
+            label_text, label_y, icon_y = "↑ 上行", y - 25, y - 10
+            fill_color, outline_color = "#E3F2FD", "#2196F3"
+        else:
+            label_text, label_y, icon_y = "↓ 下行", y - 35, y - 20
+            fill_color, outline_color = "#FFEBEE", "#F44336"
+        
+        label = self.canvas.create_text(passenger_area_start + 20, label_y, text=label_text,
+                                        font=self.get_font(9, bold=True), fill=outline_color,
+                                        tags="queue_text", state=tk.HIDDEN)
+        icons = []
+        for i in range(5):
+            x = passenger_area_start + 20 + i * 18
+            icons.append(self.canvas.create_oval(x - 6, icon_y - 6, x + 6, icon_y + 6,
+                                                 fill=fill_color, outline=outline_color, width=2,
+                                                 tags="queue_icon", state=tk.HIDDEN))
+        
+        more_x = passenger_area_start + 20 + 5 * 18 + 10
+        more_bg = self.canvas.create_oval(more_x - 8, icon_y - 6, more_x + 8, icon_y + 6,
+                                          fill="#FF9800", outline="#F57C00", width=2,
+                                          tags="more_indicator", state=tk.HIDDEN)
+        more_text = self.canvas.create_text(more_x, icon_y, text="", font=self.get_font(8, bold=True), fill="white",
+                                            tags="more_indicator", state=tk.HIDDEN)
+        return {'label': label, 'icons': icons, 'more': (more_bg, more_text), 'count': 0}
     
     def update_elevator_position(self, elevator, index):
         """更新电梯位置 - 平滑移动，避免频繁重绘，支持动态大小"""
-        # 计算电梯位置
-        current_floor = getattr(elevator, 'current_floor', 0)
-        current_floor_float = getattr(elevator, 'current_floor_float', current_floor)
+        # 电梯底部与楼层线对齐，X坐标与大小在电梯数量变化时已算好
+        y = self.elevator_base_y - elevator.current_floor_float * self.floor_height
+        x = self.elevator_x[index]
         
-        # 计算楼层线Y坐标
-        floor_y = self.canvas_height - (current_floor_float + 1) * self.floor_height
+        # 获取当前电梯状态
+        current_state = ElevatorVisualState(
+            is_idle=elevator.is_idle,
+            direction=elevator.direction,
+            passenger_count=elevator.passenger_count,
+            current_floor=elevator.current_floor,
+        )
         
-        # 根据电梯数量动态调整电梯大小
-        num_elevators = len(self.elevators)
+        # 如果电梯矩形不存在，创建它
+        if elevator.id not in self.elevator_rects:
+            self.elevator_rects[elevator.id] = self.create_elevator_rect(elevator, x, y, index)
+            self.elevator_states[elevator.id] = current_state
+            self.elevator_positions[elevator.id] = (x, y)
+        else:
+            # 检查位置或状态是否真的改变了
+            rect_id = self.elevator_rects[elevator.id]
+            previous_state = self.elevator_states.get(elevator.id)
+            
+            # 只记录目标位置，由动画循环平滑移动；位置未变的电梯不做任何画布操作
+            self.elevator_target_y[elevator.id] = y
+            if not self._animating:
+                self._animating = True
+                self.root.after(self.animation_interval_ms, self._animate_elevators)
+            
+            # 只有当状态真正改变时才更新文本内容
+            if previous_state != current_state:
+                self.elevator_states[elevator.id] = current_state
+                self.update_elevator_text(rect_id, elevator, x, y)
+    
+    def _animate_elevators(self):
+        """动画循环：每帧把各电梯向目标Y坐标移动一步，距离越远步长越大，避免模拟较快时动画明显滞后"""
+        moving = False
+        positions = self.elevator_positions
+        for elevator_id, target_y in self.elevator_target_y.items():
+            position = positions.get(elevator_id)
+            if position is None:
+                continue
+            x, y = position
+            remaining = target_y - y
+            # 与目标相差不超过1像素视为到位
+            if -1 <= remaining <= 1:
+                continue
+            max_step = max(self.animation_min_step, abs(remaining) / 4)
+            dy = max(-max_step, min(max_step, remaining))
+            # 矩形和文字共用同一个组标签，一次整体平移；Tk只重绘被移动图元新旧位置覆盖的区域
+            self.canvas.move(f"elevator_{elevator_id}", 0, dy)
+            positions[elevator_id] = (x, y + dy)
+            moving = True
+        if moving:
+            self.root.after(self.animation_interval_ms, self._animate_elevators)
+        else:
+            self._animating = False
+    
+    def layout_elevators(self, num_elevators):
+        """根据电梯数量计算电梯大小和各电梯的X坐标，只在电梯数量变化时调用"""
         self.elevator_width, self.elevator_height = self.calculate_elevator_params(num_elevators)
+        self.elevator_base_y = self.canvas_height - self.floor_height - self.elevator_height
         
-        # 计算电梯Y坐标 - 电梯底部与楼层线对齐
-        y = floor_y - self.elevator_height
-        
-        # 计算X坐标（多个电梯并排，考虑动态大小，向右偏移为乘客等待状态留空间）
+        # 多个电梯并排，考虑动态大小，向右偏移为乘客等待状态留空间
         # 为乘客等待状态预留空间（约200像素）
         passenger_area_width = 200
         available_width = self.canvas_width - passenger_area_width
         
         if num_elevators == 1:
             # 单个电梯在可用区域的中心显示
-            x = (available_width - self.elevator_width) // 2
+            self.elevator_x = [(available_width - self.elevator_width) // 2]
         else:
             # 多个电梯在可用区域内均匀分布
             total_width = num_elevators * self.elevator_width
             spacing = max(10, (available_width - total_width) // (num_elevators + 1))
-            x = spacing + index * (self.elevator_width + spacing)
-        
-        # 获取当前电梯状态
-        current_state = {
-            'is_idle': getattr(elevator, 'is_idle', True),
-            'direction': getattr(elevator, 'last_tick_direction', Direction.STOPPED),
-            'passenger_count': len(getattr(elevator, 'passengers', [])),
-            'current_floor': current_floor
-        }
+            self.elevator_x = [spacing + index * (self.elevator_width + spacing) for index in range(num_elevators)]
         
-        # 如果电梯矩形不存在，创建它
-        if elevator.id not in self.elevator_rects:
-            self.elevator_rects[elevator.id] = self.create_elevator_rect(elevator, x, y, index)
-            self.elevator_states[elevator.id] = current_state
+        # 根据电梯大小确定电梯内文字的字体和行距
+        if self.elevator_width < 50:
+            self.elevator_text_layout = (self.get_font(8, bold=True), self.get_font(6), 8)
+        elif self.elevator_width < 70:
+            self.elevator_text_layout = (self.get_font(9, bold=True), self.get_font(7), 10)
         else:
-            # 检查位置或状态是否真的改变了
-            rect_id = self.elevator_rects[elevator.id]
-            current_coords = self.canvas.coords(rect_id)
-            previous_state = self.elevator_states.get(elevator.id, {})
-            
-            position_changed = False
-            state_changed = False
-            
-            if current_coords:
-                current_x, current_y = current_coords[0], current_coords[1]
-                # 检查位置变化
-                if abs(current_x - x) > 1 or abs(current_y - y) > 1:
-                    position_changed = True
-                    # 移动现有矩形到新位置
-                    self.canvas.coords(rect_id, x, y, x + self.elevator_width, y + self.elevator_height)
-            
-            # 检查状态变化
-            if previous_state != current_state:
-                state_changed = True
-                self.elevator_states[elevator.id] = current_state
-            
-            # 只有当位置或状态真正改变时才更新文本
-            if position_changed or state_changed:
-                self.update_elevator_text(rect_id, elevator, x, y)
+            self.elevator_text_layout = (self.get_font(10, bold=True), self.get_font(8), 12)
     
     def create_elevator_rect(self, elevator, x, y, index):
         """创建电梯矩形 - 使用动态大小"""
-        # 获取电梯状态
-        is_idle = getattr(elevator, 'is_idle', True)
-        direction = getattr(elevator, 'last_tick_direction', Direction.STOPPED)
-        
         # 根据状态选择颜色
-        if is_idle:
+        if elevator.is_idle:
             fill_color = "#E8F5E8"  # 浅绿色 - 空闲
             outline_color = "#4CAF50"  # 绿色边框
         else:
-            if direction == Direction.UP:
+            if elevator.direction == Direction.UP:
                 fill_color = "#E3F2FD"  # 浅蓝色 - 上行
                 outline_color = "#2196F3"  # 蓝色边框
-            elif direction == Direction.DOWN:
+            elif elevator.direction == Direction.DOWN:
                 fill_color = "#FFF3E0"  # 浅橙色 - 下行
                 outline_color = "#FF9800"  # 橙色边框
             else:
@@ -623,7 +917,7 @@ class ElevatorGUI:
         rect_id = self.canvas.create_rectangle(
             x, y, x + self.elevator_width, y + self.elevator_height,
             fill=fill_color, outline=outline_color, width=border_width,
-            tags="elevator"
+            tags=("elevator", f"elevator_{elevator.id}")
         )
         
         # 添加电梯文本
@@ -633,67 +927,42 @@ class ElevatorGUI:
     
     def update_elevator_text(self, rect_id, elevator, x, y):
         """更新电梯内的文本 - 优化版本，避免频繁重绘，适应动态大小"""
-        # 检查文本是否已存在
-        existing_texts = self.canvas.find_withtag(f"elevator_text_{elevator.id}")
-        
-        # 根据电梯大小调整字体大小
-        if self.elevator_width < 50:
-            id_font = ("Arial", 8, "bold")
-            info_font = ("Arial", 6)
-            text_spacing = 8
-        elif self.elevator_width < 70:
-            id_font = ("Arial", 9, "bold")
-            info_font = ("Arial", 7)
-            text_spacing = 10
-        else:
-            id_font = ("Arial", 10, "bold")
-            info_font = ("Arial", 8)
-            text_spacing = 12
+        # 文字图元ID在创建时记录，直接按ID更新，无需按标签在整个画布中查找
+        texts = self.elevator_texts.get(elevator.id)
         
-        if not existing_texts:
+        if texts is None:
+            # 字体和行距随电梯大小变化，已在布局时算好
+            id_font, info_font, text_spacing = self.elevator_text_layout
+            tags = ("elevator", f"elevator_{elevator.id}")
+            
             # 如果文本不存在，创建它们
             # 电梯ID
-            self.canvas.create_text(
+            id_text = self.canvas.create_text(
                 x + self.elevator_width // 2, y + text_spacing,
                 text=f"E{elevator.id}", font=id_font,
-                fill="black", tags=f"elevator_text_{elevator.id}"
+                fill="black", tags=tags,
             )
             
             # 乘客数量
-            passenger_count = len(getattr(elevator, 'passengers', []))
-            self.canvas.create_text(
+            passenger_text = self.canvas.create_text(
                 x + self.elevator_width // 2, y + text_spacing * 2,
-                text=f"👥{passenger_count}", font=info_font,
-                fill="black", tags=f"elevator_text_{elevator.id}"
+                text=f"👥{elevator.passenger_count}", font=info_font,
+                fill="black", tags=tags,
             )
             
             # 当前楼层 - 楼层号从1开始显示
-            current_floor = getattr(elevator, 'current_floor', 0)
-            self.canvas.create_text(
+            floor_text = self.canvas.create_text(
                 x + self.elevator_width // 2, y + text_spacing * 3,
-                text=f"F{current_floor + 1}", font=info_font,
-                fill="black", tags=f"elevator_text_{elevator.id}"
+                text=f"F{elevator.current_floor + 1}", font=info_font,
+                fill="black", tags=tags,
             )
+            self.elevator_texts[elevator.id] = (id_text, passenger_text, floor_text)
         else:
-            # 如果文本已存在，只更新位置和内容
-            texts = list(existing_texts)
-            if len(texts) >= 3:
-                # 更新位置
-                self.canvas.coords(texts[0], x + self.elevator_width // 2, y + text_spacing)  # ID
-                self.canvas.coords(texts[1], x + self.elevator_width // 2, y + text_spacing * 2)  # 乘客
-                self.canvas.coords(texts[2], x + self.elevator_width // 2, y + text_spacing * 3)  # 楼层
-                
-                # 更新字体大小
-                self.canvas.itemconfig(texts[0], font=id_font)
-                self.canvas.itemconfig(texts[1], font=info_font)
-                self.canvas.itemconfig(texts[2], font=info_font)
-                
-                # 更新内容（如果需要）
-                passenger_count = len(getattr(elevator, 'passengers', []))
-                current_floor = getattr(elevator, 'current_floor', 0)
-                
-                self.canvas.itemconfig(texts[1], text=f"👥{passenger_count}")
-                self.canvas.itemconfig(texts[2], text=f"F{current_floor + 1}")
+            # 如果文本已存在，只更新内容：位置随电梯组标签整体平移，
+            # 字体只随电梯数量变化，而电梯数量变化时所有电梯图元都会重新创建
+            _, passenger_text, floor_text = texts
+            self.canvas.itemconfig(passenger_text, text=f"👥{elevator.passenger_count}")
+            self.canvas.itemconfig(floor_text, text=f"F{elevator.current_floor + 1}")
     
     def draw_elevator(self, elevator, index):
         """绘制单个电梯 - 美化版本"""
@@ -752,13 +1021,13 @@ class ElevatorGUI:
         # 绘制电梯ID - 更美观的字体
         self.canvas.create_text(
             x + self.elevator_width // 2, y + 15,
-            text=f"电梯 {elevator.id}", font=("Arial", 11, "bold"), fill=outline_color, tags="elevator"
+            text=f"电梯 {elevator.id}", font=self.get_font(11, bold=True), fill=outline_color, tags="elevator"
         )
         
         # 绘制当前楼层 - 大字体显示，楼层号从1开始显示
         self.canvas.create_text(
             x + self.elevator_width // 2, y + self.elevator_height // 2,
-            text=f"{current_floor + 1}", font=("Arial", 16, "bold"), fill="black", tags="elevator"
+            text=f"{current_floor + 1}", font=self.get_font(16, bold=True), fill="black", tags="elevator"
         )
         
         # 绘制乘客数量 - 更美观的显示
@@ -770,7 +1039,7 @@ class ElevatorGUI:
             )
             self.canvas.create_text(
                 x + 12, y + 12,
-                text=f"{passenger_count}", font=("Arial", 9, "bold"), fill="white", tags="passenger"
+                text=f"{passenger_count}", font=self.get_font(9, bold=True), fill="white", tags="passenger"
             )
         
         # 绘制方向指示器 - 更美观的箭头
@@ -810,94 +1079,156 @@ class ElevatorGUI:
             )
         
     
-    def update_elevator_display(self):
-        """更新电梯显示 - 避免重复创建组件"""
-        if not self.elevators:
+    def update_elevator_display(self, elevators):
+        """更新电梯显示 - 每部电梯的标签行只创建一次，之后只对内容发生变化的标签更新绑定的StringVar"""
+        if not elevators:
             return
+        
+        # 电梯变化（首次显示或重新开始模拟）时重建标签行
+        elevator_ids = [elevator.id for elevator in elevators]
+        if list(self.elevator_labels) != elevator_ids:
+            self.build_elevator_rows(elevator_ids)
+        
+        for elevator in elevators:
+            row = self.elevator_labels[elevator.id]
+            info = self.format_elevator_info(elevator)
+            
+            # 状态
+            if row['is_idle'] != elevator.is_idle:
+                row['is_idle'] = elevator.is_idle
+                if elevator.is_idle:
+                    row['status_var'].set("空闲")
+                    row['status'].config(style='Idle.TLabel')
+                else:
+                    row['status_var'].set("运行中")
+                    row['status'].config(style='Busy.TLabel')
             
-        # 清除现有标签
+            # 当前位置、目标楼层和乘客数量，文字未变时不更新
+            if row['info'] != info:
+                row['info'] = info
+                row['info_var'].set(info)
+    
+    def build_elevator_rows(self, elevator_ids):
+        """按给定顺序创建各电梯的标签行，状态和信息标签绑定StringVar，由Tk在变量更新时重绘"""
         for widget in self.elevator_scroll_frame.winfo_children():
             widget.destroy()
         self.elevator_labels = {}
-            
-        # 创建电梯信息
-        for elevator in self.elevators:
+        
+        for elevator_id in elevator_ids:
             frame = ttk.Frame(self.elevator_scroll_frame)
             frame.pack(fill=tk.X, pady=2)
             
             # 电梯ID
-            ttk.Label(frame, text=f"电梯 {elevator.id}", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=(0, 5))
-            
-            # 当前位置 - 楼层号从1开始显示
-            current_floor = getattr(elevator, 'current_floor', 0)
-            ttk.Label(frame, text=f"F{current_floor + 1}").pack(side=tk.LEFT, padx=(0, 5))
-            
-            # 目标楼层 - 楼层号从1开始显示
-            target_floor = getattr(elevator, 'target_floor', current_floor)
-            ttk.Label(frame, text=f"→F{target_floor + 1}").pack(side=tk.LEFT, padx=(0, 5))
+            id_label = ttk.Label(frame, text=f"电梯 {elevator_id}", style='RowTitle.TLabel')
+            id_label.pack(side=tk.LEFT, padx=(0, 5))
             
             # 状态
-            status = "运行中" if not getattr(elevator, 'is_idle', True) else "空闲"
-            status_color = "red" if status == "运行中" else "green"
-            status_label = ttk.Label(frame, text=status, foreground=status_color)
+            status_var = tk.StringVar(self.root)
+            status_label = ttk.Label(frame, textvariable=status_var)
             status_label.pack(side=tk.LEFT, padx=(0, 5))
             
-            # 乘客数量
-            passenger_count = len(getattr(elevator, 'passengers', []))
-            ttk.Label(frame, text=f"👥{passenger_count}").pack(side=tk.LEFT)
+            # 当前位置、目标楼层和乘客数量合并为一个标签
+            info_var = tk.StringVar(self.root)
+            ttk.Label(frame, textvariable=info_var).pack(side=tk.LEFT)
+            
+            self.elevator_labels[elevator_id] = {
+                'status': status_label,
+                'status_var': status_var,
+                'info_var': info_var,
+                'is_idle': None,  # 上次显示的状态和文字，None表示尚未显示
+                'info': None,
+            }
+    
+    @staticmethod
+    def format_elevator_info(elevator):
+        """电梯面板的位置/目标/乘客文本，一次格式化生成；楼层号从1开始显示"""
+        return f"F{elevator.current_floor + 1}  →F{elevator.target_floor + 1}  👥{elevator.passenger_count}"
     
-    def update_floor_display(self):
-        """更新楼层显示"""
-        # 清除现有标签
+    def update_floor_display(self, floors):
+        """更新楼层显示 - 每层的标签只创建一次，之后只更新等待人数发生变化的楼层"""
+        if not floors:
+            # 清除现有标签
+            for widget in self.floor_scroll_frame.winfo_children():
+                widget.destroy()
+            self.floor_labels = {}
+            return
+        
+        # 从高楼层到低楼层显示；楼层变化（首次显示或重新开始模拟）时重建标签
+        floors = floors[::-1]
+        floor_nums = [floor.floor for floor in floors]
+        if list(self.floor_labels) != floor_nums:
+            self.build_floor_rows(floor_nums)
+        
+        for floor_num, up_count, down_count in floors:
+            row = self.floor_labels[floor_num]
+            if row['counts'] == (up_count, down_count):
+                continue
+            row['counts'] = (up_count, down_count)
+            
+            # 上行队列：始终紧跟楼层号
+            if up_count > 0:
+                row['up'].config(text=f"↑{up_count}")
+                row['up'].pack(side=tk.LEFT, padx=(0, 5), after=row['floor'])
+            else:
+                row['up'].pack_forget()
+            
+            # 下行队列：始终位于状态之前
+            if down_count > 0:
+                row['down'].config(text=f"↓{down_count}")
+                row['down'].pack(side=tk.LEFT, padx=(0, 5), before=row['status'])
+            else:
+                row['down'].pack_forget()
+            
+            # 总等待人数
+            total_waiting = up_count + down_count
+            if total_waiting > 0:
+                row['status'].config(text=f"等待:{total_waiting}", style='Waiting.TLabel')
+            else:
+                row['status'].config(text="空闲", style='Idle.TLabel')
+    
+    def build_floor_rows(self, floor_nums):
+        """按给定顺序创建各楼层的标签行，初始为无人等待"""
         for widget in self.floor_scroll_frame.winfo_children():
             widget.destroy()
         self.floor_labels = {}
         
-        if not self.floors:
-            return
-            
-        # 创建楼层信息 - 从高楼层到低楼层显示
-        for floor in reversed(self.floors):
+        for floor_num in floor_nums:
             frame = ttk.Frame(self.floor_scroll_frame)
             frame.pack(fill=tk.X, pady=1)
             
             # 楼层号 - 楼层号从1开始显示
-            floor_num = getattr(floor, 'floor', 0)
-            ttk.Label(frame, text=f"F{floor_num + 1}", font=("Arial", 9, "bold")).pack(side=tk.LEFT, padx=(0, 5))
+            floor_label = ttk.Label(frame, text=f"F{floor_num + 1}", style='FloorTitle.TLabel')
+            floor_label.pack(side=tk.LEFT, padx=(0, 5))
             
-            # 上行队列
-            up_queue = getattr(floor, 'up_queue', [])
-            up_count = len(up_queue) if up_queue else 0
-            if up_count > 0:
-                ttk.Label(frame, text=f"↑{up_count}", foreground="blue").pack(side=tk.LEFT, padx=(0, 5))
+            # 上下行队列标签在有人等待时才显示
+            up_label = ttk.Label(frame, style='Up.TLabel')
+            down_label = ttk.Label(frame, style='Down.TLabel')
             
-            # 下行队列
-            down_queue = getattr(floor, 'down_queue', [])
-            down_count = len(down_queue) if down_queue else 0
-            if down_count > 0:
-                ttk.Label(frame, text=f"↓{down_count}", foreground="red").pack(side=tk.LEFT, padx=(0, 5))
+            status_label = ttk.Label(frame, text="空闲", style='Idle.TLabel')
+            status_label.pack(side=tk.LEFT, padx=(5, 0))
             
-            # 总等待人数
-            total_waiting = up_count + down_count
-            if total_waiting > 0:
-                ttk.Label(frame, text=f"等待:{total_waiting}", foreground="orange").pack(side=tk.LEFT, padx=(5, 0))
-            else:
-                ttk.Label(frame, text="空闲", foreground="green").pack(side=tk.LEFT, padx=(5, 0))
+            self.floor_labels[floor_num] = {
+                'floor': floor_label,
+                'up': up_label,
+                'down': down_label,
+                'status': status_label,
+                'counts': (0, 0),
+            }
     
-    def update_stats_display(self):
+    def update_stats_display(self, stats):
         """更新统计信息显示"""
-        # 显示从控制器获取的统计信息
-        if self.controller and hasattr(self.controller, 'user_data'):
-            total_passengers = len(self.controller.user_data)
-            completed_passengers = sum(1 for data in self.controller.user_data.values() 
-                                     if data.get('completed', False))
+        # 显示快照中从控制器获取的统计信息
+        if stats is not None:
+            total_passengers, completed_passengers = stats
             
-            self.stats_labels['total_passengers'].config(text=str(total_passengers))
-            self.stats_labels['completed_passengers'].config(text=str(completed_passengers))
+            self.set_label_text('total_passengers', self.stats_labels['total_passengers'], str(total_passengers))
+            self.set_label_text(
+                'completed_passengers', self.stats_labels['completed_passengers'], str(completed_passengers)
+            )
             
             if total_passengers > 0:
                 completion_rate = completed_passengers / total_passengers
-                self.stats_labels['completion_rate'].config(text=f"{completion_rate:.2%}")
+                self.set_label_text('completion_rate', self.stats_labels['completion_rate'], f"{completion_rate:.2%}")
     
     def run(self):
         """运行GUI"""